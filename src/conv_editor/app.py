@@ -1,12 +1,7 @@
 import logging
 import sys
 
-from PySide6.QtGui import QFont
-from PySide6.QtWidgets import QApplication, QMessageBox
-
 from conv_editor.config.logging_config import setup_logging
-from conv_editor.config.settings import settings
-from conv_editor.ui.main_window import MainWindow
 
 logger = logging.getLogger(__name__)
 
@@ -15,8 +10,17 @@ def run():
     setup_logging()
     logger.info("Starting Conversation Editor application.")
 
+    # Qt and the settings model are imported here rather than at module level so that
+    # importing the package (e.g. from tools or tests) does not pay their start-up cost.
+    from PySide6.QtGui import QFont
+    from PySide6.QtWidgets import QApplication, QMessageBox
+
     try:
+        from conv_editor.config.settings import get_settings
+        from conv_editor.ui.main_window import MainWindow
+
         app = QApplication(sys.argv)
+        settings = get_settings()
         QApplication.setOrganizationName(settings.APP_ORGANIZATION_NAME)
         QApplication.setApplicationName(settings.APP_NAME)
 
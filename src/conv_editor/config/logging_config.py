@@ -1,17 +1,26 @@
 import logging
 import sys
 
+LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+_QUIET_LOGGERS = ("openai", "httpcore", "httpx")
+
+_LOGGING_DONE = False
+
 
 def setup_logging():
-    log_format = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+    global _LOGGING_DONE
+    if _LOGGING_DONE:
+        return
+
     logging.basicConfig(
         level=logging.DEBUG,
-        format=log_format,
+        format=LOG_FORMAT,
         stream=sys.stdout,
         force=True,
     )
     logging.getLogger(__name__).info("Logging configured successfully.")
 
-    logging.getLogger("openai").setLevel(logging.WARNING)
-    logging.getLogger("httpcore").setLevel(logging.WARNING)
-    logging.getLogger("httpx").setLevel(logging.WARNING)
+    for name in _QUIET_LOGGERS:
+        logging.getLogger(name).setLevel(logging.WARNING)
+
+    _LOGGING_DONE = True
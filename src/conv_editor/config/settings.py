@@ -1,3 +1,4 @@
+import functools
 from typing import Optional
 
 from pydantic import Field
@@ -19,6 +20,8 @@ class Settings(BaseSettings):
     APP_ASSISTANT_NAME: str = "assistant"
     APP_USE_REASONING: bool = False
     APP_SEARCH_SCORE_CUTOFF: int = Field(75, ge=0, le=100)
+    APP_UNDO_STACK_MAX: int = Field(500, ge=1)
+    APP_USE_NATIVE_DIALOGS: Optional[bool] = None  # None: use them unless the desktop is known to stall on them
 
     # Theme Settings
     APP_THEME_UNLEARNABLE_BG: str = "#5A3A3A"  # Dark, desaturated red
@@ -28,4 +31,13 @@ class Settings(BaseSettings):
     APP_THEME_TOOL_RESULTS_BG: str = "#2A4D3B"  # Dark, desaturated green
 
 
-settings = Settings()
+@functools.lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    # Built on first call so that importing this module does not read `.env`.
+    return Settings()
+
+
+def __getattr__(name: str):
+    if name == "settings":
+        return get_settings()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
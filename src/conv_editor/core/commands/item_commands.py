@@ -33,6 +33,7 @@ class RemoveItemCommand(BaseCommand):
     def undo(self):
         if self.removed_item:
             self.conversation.data.insert(self.index, self.removed_item)
+            self.conversation._invalidate_fmt()
 
 
 class MoveItemCommand(BaseCommand):
@@ -43,10 +44,10 @@ class MoveItemCommand(BaseCommand):
         self.final_target_index = -1
 
     def execute(self):
-        item_to_move = self.conversation.data[self.source_index]
-        temp_data = self.conversation.data[: self.source_index] + self.conversation.data[self.source_index + 1 :]
-        temp_data.insert(self.target_index if self.source_index > self.target_index else self.target_index - 1, item_to_move)
-        self.final_target_index = temp_data.index(item_to_move)
+        if self.source_index < self.target_index:
+            self.final_target_index = self.target_index - 1
+        else:
+            self.final_target_index = self.target_index
 
         self.conversation.move_item(self.source_index, self.target_index)
 
@@ -1,4 +1,5 @@
 from collections import deque
+from typing import Optional
 
 from PySide6.QtCore import QObject, Signal
 
@@ -11,10 +12,10 @@ class UndoManager(QObject):
     cleanChanged = Signal(bool)
     command_executed = Signal()
 
-    def __init__(self, parent=None):
+    def __init__(self, max_size: Optional[int] = None, parent=None):
         super().__init__(parent)
-        self.undo_stack: deque[BaseCommand] = deque()
-        self.redo_stack: deque[BaseCommand] = deque()
+        self.undo_stack: deque[BaseCommand] = deque(maxlen=max_size)
+        self.redo_stack: deque[BaseCommand] = deque(maxlen=max_size)
         self.clean_index = 0
 
     @property
@@ -30,53 +31,64 @@ class UndoManager(QObject):
         return len(self.undo_stack) == self.clean_index
 
     def do(self, command: BaseCommand):
-        old_can_undo = self.can_undo
-        old_can_redo = self.can_redo
-        old_is_clean = self.is_clean
+        undo_stack = self.undo_stack
+        was_clean = len(undo_stack) == self.clean_index
 
         command.execute()
 
-        self.undo_stack.append(command)
+        if self.clean_index > len(undo_stack):
+            # The saved state lives in the redo stack, which this command discards.
+            self.clean_index = -1
+
+        # A burst of edits to the same block collapses into the previous entry, unless that entry marks the saved state.
+        if not (undo_stack and not was_clean and undo_stack[-1].merge_with(command)):
+            if len(undo_stack) == undo_stack.maxlen:
+                # The oldest entry is about to fall off; once the saved state goes with it, it can no longer be reached.
+                self.clean_index = self.clean_index - 1 if self.clean_index > 0 else -1
+            undo_stack.append(command)
         self.redo_stack.clear()
 
-        if old_can_undo != self.can_undo:
-            self.canUndoChanged.emit(self.can_undo)
-        if old_can_redo != self.can_redo:
-            self.canRedoChanged.emit(self.can_redo)
-        if old_is_clean != self.is_clean:
-            self.cleanChanged.emit(not self.is_clean)
+        self.canUndoChanged.emit(True)
+        self.canRedoChanged.emit(False)
+        is_clean = len(undo_stack) == self.clean_index
+        if was_clean != is_clean:
+            self.cleanChanged.emit(not is_clean)
 
         self.command_executed.emit()
 
     def undo(self):
-        if not self.can_undo:
+        undo_stack = self.undo_stack
+        if not undo_stack:
             return
 
-        old_is_clean = self.is_clean
-        command = self.undo_stack.pop()
+        was_clean = len(undo_stack) == self.clean_index
+        command = undo_stack.pop()
         command.undo()
         self.redo_stack.append(command)
 
-        self.canUndoChanged.emit(self.can_undo)
-        self.canRedoChanged.emit(self.can_redo)
-        if old_is_clean != self.is_clean:
-            self.cleanChanged.emit(not self.is_clean)
+        self.canUndoChanged.emit(bool(undo_stack))
+        self.canRedoChanged.emit(True)
+        is_clean = len(undo_stack) == self.clean_index
+        if was_clean != is_clean:
+            self.cleanChanged.emit(not is_clean)
 
         self.command_executed.emit()
 
     def redo(self):
-        if not self.can_redo:
+        redo_stack = self.redo_stack
+        if not redo_stack:
             return
 
-        old_is_clean = self.is_clean
-        command = self.redo_stack.pop()
+        was_clean = len(self.undo_stack) == self.clean_index
+        command = redo_stack.pop()
         command.redo()
         self.undo_stack.append(command)
 
-        self.canUndoChanged.emit(self.can_undo)
-        self.canRedoChanged.emit(self.can_redo)
-        if old_is_clean != self.is_clean:
-            self.cleanChanged.emit(not self.is_clean)
+        self.canUndoChanged.emit(True)
+        self.canRedoChanged.emit(bool(redo_stack))
+        is_clean = len(self.undo_stack) == self.clean_index
+        if was_clean != is_clean:
+            self.cleanChanged.emit(not is_clean)
 
         self.command_executed.emit()
 
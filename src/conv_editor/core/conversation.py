@@ -1,16 +1,20 @@
-import json
 import logging
 from datetime import datetime
+from functools import cached_property
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Tuple, TYPE_CHECKING, Union
 
-from pydantic import ValidationError
+from pydantic import TypeAdapter, ValidationError
 
-from conv_editor.core.formatter import PromptFormatter
 from conv_editor.core.models import ConversationData, Item, TextContent, TextSegment
 
+if TYPE_CHECKING:
+    from conv_editor.core.formatter import PromptFormatter
+
 logger = logging.getLogger(__name__)
 
+_CONV_ADAPTER = TypeAdapter(ConversationData)
+
 
 class Conversation:
     def __init__(self, assistant_name: str):
@@ -18,7 +22,14 @@ class Conversation:
         self.file_path: Optional[Path] = None
         self.assistant_name = assistant_name
         self._has_unsaved_changes = False
-        self.formatter = PromptFormatter(json_indent=0)
+        # item index -> (with_reason, formatted turn); dropped by whatever mutates the item.
+        self._fmt_cache: Dict[int, Tuple[bool, str]] = {}
+
+    @cached_property
+    def formatter(self) -> "PromptFormatter":
+        from conv_editor.core.formatter import PromptFormatter
+
+        return PromptFormatter(json_indent=0)
 
     @property
     def has_unsaved_changes(self) -> bool:
@@ -33,24 +44,22 @@ class Conversation:
     def load(self, file_path: Union[str, Path], root_dir: Optional[Path] = None):
         self.file_path = Path(file_path)
         try:
-            with self.file_path.open("r", encoding="utf-8") as f:
-                raw_data = json.load(f) or []
-            self.data = [Item.model_validate(item) for item in raw_data]
+            raw = self.file_path.read_bytes()
+            self.data = _CONV_ADAPTER.validate_json(raw) if raw.strip() else []
             logger.info(f"Loaded conversation from {self.file_path}")
-        except (FileNotFoundError, json.JSONDecodeError, ValidationError) as e:
+        except (FileNotFoundError, ValidationError) as e:
             self.data = []
             logger.error(f"Failed to load or validate file '{self.file_path}': {e}")
 
         prompt_added = self._ensure_system_prompt(root_dir)
         self._has_unsaved_changes = prompt_added
+        self._invalidate_fmt()
 
     def save(self):
         if not self.file_path:
             raise ValueError("File path is not set. Cannot save.")
         try:
-            with self.file_path.open("w", encoding="utf-8") as f:
-                json_data = [item.model_dump() for item in self.data]
-                json.dump(json_data, f, indent=2, ensure_ascii=False)
+            self.file_path.write_bytes(_CONV_ADAPTER.dump_json(self.data, indent=2))
             self._has_unsaved_changes = False
             logger.info(f"Saved conversation to {self.file_path}")
         except Exception as e:
@@ -69,12 +78,14 @@ class Conversation:
         new_item = Item(role=role, content=[])
         self.data.insert(index, new_item)
         self._has_unsaved_changes = True
+        self._invalidate_fmt()
         return new_item
 
     def update_item(self, index: int, item: Item):
         if 0 <= index < len(self.data):
             self.data[index] = item
             self._has_unsaved_changes = True
+            self._invalidate_fmt(index)
         else:
             raise IndexError("Item index out of range.")
 
@@ -82,6 +93,7 @@ class Conversation:
         if 0 <= index < len(self.data):
             del self.data[index]
             self._has_unsaved_changes = True
+            self._invalidate_fmt()
         else:
             raise IndexError("Item index out of range.")
 
@@ -99,6 +111,7 @@ class Conversation:
 
         self.data.insert(target_index, item_to_move)
         self._has_unsaved_changes = True
+        self._invalidate_fmt()
         logger.debug(f"Moved item from index {source_index} to {target_index}")
 
     def move_content(self, source_item_idx: int, source_content_idx: int, target_item_idx: int, target_content_idx: int):
@@ -120,12 +133,15 @@ class Conversation:
 
         target_item.content.insert(target_content_idx, content_to_move)
         self._has_unsaved_changes = True
+        self._invalidate_fmt(source_item_idx)
+        self._invalidate_fmt(target_item_idx)
         logger.debug(f"Moved content from item[{source_item_idx}][{source_content_idx}] to item[{target_item_idx}][{target_content_idx}]")
 
     def discard_and_close(self):
         self.data = []
         self.file_path = None
         self._has_unsaved_changes = False
+        self._invalidate_fmt()
 
     def delete_file(self):
         if not self.file_path:
@@ -140,34 +156,39 @@ class Conversation:
     def get_all_items(self) -> ConversationData:
         return self.data
 
+    def _invalidate_fmt(self, item_index: Optional[int] = None):
+        if item_index is None:
+            self._fmt_cache.clear()
+        else:
+            self._fmt_cache.pop(item_index, None)
+
     def get_data_slice_as_string(self, end_idx: int, with_reason: bool) -> str:
-        return self.formatter(
-            data_slice=self.data[:end_idx],
-            assistant_name=self.assistant_name,
-            with_reason=with_reason,
-        )
+        cache = self._fmt_cache
+        format_item = self.formatter.format_item
+        chunks = []
+        for index, item in enumerate(self.data[:end_idx]):
+            cached = cache.get(index)
+            if cached is None or cached[0] != with_reason:
+                cached = cache[index] = (with_reason, format_item(item, with_reason))
+            chunks.append(cached[1])
+        return self.formatter.assemble(chunks, self.assistant_name)
 
     def get_data_slice_for_chat(self, end_idx: int, with_reason: bool) -> List[Dict[str, Any]]:
+        role_map = {"system": "system", self.assistant_name: "assistant"}
         res = []
         for item in self.data[:end_idx]:
-            username = ""
-            if item.role == self.assistant_name:
-                api_role = "assistant"
-            elif item.role == "system":
-                api_role = "system"
-            else:
-                api_role = "user"
-                username = item.role + ": "
-
-            content_str = ""
+            api_role = role_map.get(item.role, "user")
+            pieces = [item.role + ": "] if api_role == "user" else []
             for content_part in item.content:
-                if hasattr(content_part, "full_text"):
-                    if content_part.type == "reason":
-                        if with_reason:
-                            content_str += f"<think>{content_part.full_text}</think>\n"
-                    else:
-                        content_str += content_part.full_text
-            res.append({"role": api_role, "content": username + content_str})
+                full_text = getattr(content_part, "full_text", None)
+                if full_text is None:
+                    continue
+                if content_part.type == "reason":
+                    if with_reason:
+                        pieces.append(f"<think>{full_text}</think>\n")
+                else:
+                    pieces.append(full_text)
+            res.append({"role": api_role, "content": "".join(pieces)})
         return res
 
     def _ensure_system_prompt(self, root_dir: Optional[Path] = None) -> bool:
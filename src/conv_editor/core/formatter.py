@@ -1,15 +1,22 @@
-import json
-from typing import Dict, Optional
+from typing import Callable, Dict, Iterable, List, Optional
+
+from pydantic import TypeAdapter
 
 from conv_editor.core.models import (
     ConversationData,
-    ReasoningContent,
-    TextContent,
+    Item,
+    ToolCall,
     ToolCallContent,
+    ToolDefinition,
+    ToolResult,
     ToolResultsContent,
     ToolsContent,
 )
 
+_TOOLS_ADAPTER = TypeAdapter(List[ToolDefinition])
+_CALL_ADAPTER = TypeAdapter(ToolCall)
+_RESULTS_ADAPTER = TypeAdapter(List[ToolResult])
+
 
 class PromptFormatter:
     DEFAULT_TOKENS = {
@@ -33,20 +40,35 @@ class PromptFormatter:
             self.tokens.update(special_tokens)
         self.json_indent = json_indent
 
+        tokens = self.tokens
+        self._bos = tokens["bos"]
+        self._header_fmt = f"\n{tokens['header_start']}{{}}{tokens['header_end']}\n".format
+        self._turn_tail = f"\n{tokens['eot']}"
+
+        think_start, think_end = tokens["think_start"], tokens["think_end"]
+        common: Dict[str, Callable] = {
+            "text": lambda p: p.full_text,
+            "tools": self._serialize_tools,
+            "tool_call": self._serialize_tool_calls,
+            "tool_response": self._serialize_tool_results,
+        }
+        self._handlers = {
+            True: {**common, "reason": lambda p: f"{think_start}{p.full_text}{think_end}"},
+            False: {**common, "reason": lambda p: ""},
+        }
+
     def _serialize_tools(self, content: ToolsContent) -> str:
         try:
-            definitions_as_dicts = [d.model_dump(exclude_none=True) for d in content.definitions]
-            json_str = json.dumps(definitions_as_dicts, indent=self.json_indent)
+            json_str = _TOOLS_ADAPTER.dump_json(content.definitions, exclude_none=True, indent=self.json_indent).decode()
             return f"{self.tokens['tools_start']}\n{json_str}\n{self.tokens['tools_end']}"
         except Exception:
             return f"{self.tokens['tools_start']}\n[]\n{self.tokens['tools_end']}"
 
     def _serialize_tool_calls(self, content: ToolCallContent) -> str:
         try:
-            calls_as_dicts = [c.model_dump(exclude_none=True) for c in content.calls]
             call_strings = []
-            for call_dict in calls_as_dicts:
-                json_str = json.dumps(call_dict, indent=self.json_indent)
+            for call in content.calls:
+                json_str = _CALL_ADAPTER.dump_json(call, exclude_none=True, indent=self.json_indent).decode()
                 call_strings.append(f"{self.tokens['tool_call_start']}\n{json_str}\n{self.tokens['tool_call_end']}")
             return "\n".join(call_strings)
         except Exception:
@@ -54,44 +76,26 @@ class PromptFormatter:
 
     def _serialize_tool_results(self, content: ToolResultsContent) -> str:
         try:
-            results_as_dicts = [r.model_dump(exclude_none=True) for r in content.results]
-            json_str = json.dumps(results_as_dicts, indent=self.json_indent)
+            json_str = _RESULTS_ADAPTER.dump_json(content.results, exclude_none=True, indent=self.json_indent).decode()
             return f"{self.tokens['tool_response_start']}\n{json_str}\n{self.tokens['tool_response_end']}"
         except Exception:
             return f"{self.tokens['tool_response_start']}\n[]\n{self.tokens['tool_response_end']}"
 
+    def format_item(self, item: Item, with_reason: bool) -> str:
+        handlers = self._handlers[bool(with_reason)]
+        parts = [self._header_fmt(item.role)]
+        parts.extend(handlers[content_part.type](content_part) for content_part in item.content)
+        parts.append(self._turn_tail)
+        return "".join(parts)
+
+    def assemble(self, formatted_items: Iterable[str], assistant_name: str) -> str:
+        # generation prompt for the assistant
+        return self._bos + "".join(formatted_items) + self._header_fmt(assistant_name)
+
     def __call__(
         self,
         data_slice: ConversationData,
         assistant_name: str,
         with_reason: bool,
     ) -> str:
-        parts = [self.tokens["bos"]]
-
-        for item in data_slice:
-            header = f"\n{self.tokens['header_start']}{item.role}{self.tokens['header_end']}\n"
-            turn_content_parts = []
-
-            for content_part in item.content:
-                if isinstance(content_part, TextContent):
-                    turn_content_parts.append(content_part.full_text)
-                elif isinstance(content_part, ReasoningContent):
-                    if with_reason:
-                        think_block = f"{self.tokens['think_start']}{content_part.full_text}{self.tokens['think_end']}"
-                        turn_content_parts.append(think_block)
-                elif isinstance(content_part, ToolsContent):
-                    turn_content_parts.append(self._serialize_tools(content_part))
-                elif isinstance(content_part, ToolCallContent):
-                    turn_content_parts.append(self._serialize_tool_calls(content_part))
-                elif isinstance(content_part, ToolResultsContent):
-                    turn_content_parts.append(self._serialize_tool_results(content_part))
-
-            full_turn_content = "".join(turn_content_parts)
-            turn_string = f"{header}{full_turn_content}\n{self.tokens['eot']}"
-            parts.append(turn_string)
-
-        # generation prompt for the assistant
-        assistant_prompt = f"\n{self.tokens['header_start']}{assistant_name}{self.tokens['header_end']}\n"
-        parts.append(assistant_prompt)
-
-        return "".join(parts)
+        return self.assemble((self.format_item(item, with_reason) for item in data_slice), assistant_name)
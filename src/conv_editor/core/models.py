@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import Annotated, Any, Dict, List, Literal, Optional, Tuple, Union
 
 from pydantic import BaseModel, Field, field_validator, ValidationInfo
@@ -22,10 +23,15 @@ class TextContent(BaseModel):
             return [TextSegment(text="")]
         return v
 
-    @property
+    @cached_property
     def full_text(self) -> str:
         return "".join(s.text for s in self.segments)
 
+    def __setattr__(self, name: str, value: Any):
+        super().__setattr__(name, value)
+        if name == "segments":
+            self.__dict__.pop("full_text", None)
+
 
 class ReasoningContent(BaseModel):
     type: Literal["reason"] = "reason"
@@ -40,10 +46,15 @@ class ReasoningContent(BaseModel):
             return [TextSegment(text="")]
         return v
 
-    @property
+    @cached_property
     def full_text(self) -> str:
         return "".join(s.text for s in self.segments)
 
+    def __setattr__(self, name: str, value: Any):
+        super().__setattr__(name, value)
+        if name == "segments":
+            self.__dict__.pop("full_text", None)
+
 
 class ToolProperty(BaseModel):
     type: Union[str, List[str]]
@@ -117,3 +128,4 @@ class SearchMatch(BaseModel):
     score: float
     match_indices: Optional[Tuple[int, int]] = None
     item_index: Optional[int] = None
+    pretty_preview: Optional[str] = None
@@ -26,3 +26,8 @@ class ExportConfig(BaseModel):
     special_tokens: SpecialTokensConfig = Field(default_factory=SpecialTokensConfig, description="Configuration for all special tokens.")
     cross_entropy_ignore_index: int = Field(-100, description="Index to use for non-learnable tokens in the labels.")
     assistant_name: str = Field("assistant", description="The role name used for the assistant.")
+    merge_adjacent_segments: bool = Field(True, description="Tokenize neighbouring text segments with the same learnable flag as one run.")
+    encode_batch_size: int = Field(64, ge=1, description="Number of conversations tokenized together in one encode_batch call.")
+    num_workers: int = Field(1, ge=1, description="Number of tokenizer processes; 1 tokenizes in the export thread itself.")
+    compact_dtype: bool = Field(True, description="Store token ids as 16-bit integers when the tokenizer's vocabulary fits.")
+    store_labels_as_mask: bool = Field(False, description="Write a uint8 learnable mask instead of a labels dataset.")
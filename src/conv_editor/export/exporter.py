@@ -1,15 +1,18 @@
 import json
 import logging
-from typing import Dict, List
+from itertools import chain, groupby, islice
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
 
 import numpy as np
 from tokenizers import Tokenizer
 
 from conv_editor.core.models import (
+    ContentItem,
     ConversationData,
     Item,
     ReasoningContent,
     TextContent,
+    TextSegment,
     ToolCallContent,
     ToolResultsContent,
     ToolsContent,
@@ -18,6 +21,9 @@ from conv_editor.export.config import ExportConfig
 
 logger = logging.getLogger(__name__)
 
+# A fragment is either text still to be tokenized or the already-known ids of a constant marker.
+Fragment = Union[str, Tuple[int, ...]]
+
 
 class TrainingExporter:
     def __init__(self, tokenizer: Tokenizer, config: ExportConfig):
@@ -25,6 +31,30 @@ class TrainingExporter:
         self.config = config
         self.tokens = config.special_tokens
 
+        self._bos_ids = self._encode_constant(self.tokens.bos)
+        self._eot_ids = self._encode_constant(self.tokens.eot)
+        self._think_start_ids = self._encode_constant(self.tokens.think_start)
+        self._think_end_nl_ids = self._encode_constant(self.tokens.think_end + "\n")
+        self._header_cache: Dict[str, Tuple[int, ...]] = {}
+
+        # Content parts are dispatched on their `type` tag, as PromptFormatter does.
+        self._handlers: Dict[str, Callable[[ContentItem, List[Fragment], List[bool], bool], None]] = {
+            "text": self._collect_text,
+            "reason": self._collect_reasoning,
+            "tool_call": self._collect_tool_calls,
+            "tools": self._collect_tools,
+            "tool_response": self._collect_tool_results,
+        }
+
+    def _encode_constant(self, text: str) -> Tuple[int, ...]:
+        return tuple(self.tokenizer.encode(text, add_special_tokens=False).ids)
+
+    def _header_ids(self, role: str) -> Tuple[int, ...]:
+        ids = self._header_cache.get(role)
+        if ids is None:
+            ids = self._header_cache[role] = self._encode_constant(f"\n{self.tokens.header_start}{role}{self.tokens.header_end}\n")
+        return ids
+
     def _serialize_tools(self, content: ToolsContent) -> str:
         try:
             definitions_as_dicts = [d.model_dump(exclude_none=True) for d in content.definitions]
@@ -53,79 +83,91 @@ class TrainingExporter:
             return f"{self.tokens.tool_response_start}[]{self.tokens.tool_response_end}"
 
     def process_conversation(self, conversation_data: ConversationData) -> Dict[str, np.ndarray]:
-        all_input_ids: List[int] = []
-        all_labels: List[int] = []
+        return next(self.process_many([conversation_data]))
+
+    def process_many(self, conversations: Iterable[ConversationData], batch_size: Optional[int] = None) -> Iterator[Dict[str, np.ndarray]]:
+        batch_size = batch_size or self.config.encode_batch_size
+        it = iter(conversations)
+        while batch := list(islice(it, batch_size)):
+            yield from self._process_batch(batch)
+
+    def _process_batch(self, batch: List[ConversationData]) -> Iterator[Dict[str, np.ndarray]]:
+        # Every text fragment is collected first and tokenized in one encode_batch call (marker ids are cached);
+        # `learnable` runs parallel to `fragments` and says whether that fragment's ids are trained on or masked.
+        fragments: List[Fragment] = []
+        learnable: List[bool] = []
+        offsets = [0]
+        for conversation_data in batch:
+            fragments.append(self._bos_ids)
+            learnable.append(False)
+            for item in conversation_data:
+                self._collect_item(item, fragments, learnable)
+            offsets.append(len(fragments))
+
+        encodings = iter(self.tokenizer.encode_batch([f for f in fragments if isinstance(f, str)], add_special_tokens=False))
+        fragment_ids = [next(encodings).ids if isinstance(f, str) else f for f in fragments]
+
+        for start, end in zip(offsets, offsets[1:]):
+            yield self._to_arrays(fragment_ids[start:end], learnable[start:end])
+
+    def _to_arrays(self, fragment_ids: List[Sequence[int]], learnable: List[bool]) -> Dict[str, np.ndarray]:
+        lengths = np.fromiter(map(len, fragment_ids), dtype=np.intp, count=len(fragment_ids))
+
+        # The total length is known once everything is encoded, so input_ids is allocated exactly once.
+        input_ids = np.fromiter(chain.from_iterable(fragment_ids), dtype=np.int32, count=int(lengths.sum()))
+        token_learnable = np.repeat(np.asarray(learnable, dtype=bool), lengths)
+        labels = np.where(token_learnable, input_ids, np.int32(self.config.cross_entropy_ignore_index))
+
+        return {"input_ids": input_ids, "labels": labels}
+
+    def _collect_item(self, item: Item, fragments: List[Fragment], learnable: List[bool]):
+        is_assistant_turn = item.role == self.config.assistant_name
 
-        bos_encoding = self.tokenizer.encode(self.tokens.bos, add_special_tokens=False)
-        all_input_ids.extend(bos_encoding.ids)
-        all_labels.extend([self.config.cross_entropy_ignore_index] * len(bos_encoding.ids))
+        fragments.append(self._header_ids(item.role))
+        learnable.append(False)
 
-        for item in conversation_data:
-            self._process_item(item, all_input_ids, all_labels)
+        handlers = self._handlers
+        for content_part in item.content:
+            handlers[content_part.type](content_part, fragments, learnable, is_assistant_turn)
 
-        return {
-            "input_ids": np.array(all_input_ids, dtype=np.int32),
-            "labels": np.array(all_labels, dtype=np.int32),
-        }
+        fragments.append(self._eot_ids)
+        learnable.append(is_assistant_turn)  # assistant should know when to stop yapping
 
-    def _process_item(self, item: Item, all_input_ids: List[int], all_labels: List[int]):
-        ignore = self.config.cross_entropy_ignore_index
-        is_assistant_turn = item.role == self.config.assistant_name
+    def _collect_segments(self, segments: List[TextSegment], fragments: List[Fragment], learnable: List[bool], allow_learnable: bool):
+        if not self.config.merge_adjacent_segments:
+            # Each segment stays its own fragment so it keeps its own learnable mask.
+            for segment in segments:
+                fragments.append(segment.text)
+                learnable.append(segment.learnable and allow_learnable)
+            return
 
-        header_str = f"\n{self.tokens.header_start}{item.role}{self.tokens.header_end}\n"
-        header_encoding = self.tokenizer.encode(header_str, add_special_tokens=False)
-        all_input_ids.extend(header_encoding.ids)
-        all_labels.extend([ignore] * len(header_encoding.ids))
+        # Neighbouring segments with the same mask are tokenized as one run, so BPE merges can cross the seam.
+        for is_learnable, run in groupby(segments, key=lambda segment: segment.learnable and allow_learnable):
+            fragments.append("".join(segment.text for segment in run))
+            learnable.append(is_learnable)
 
-        for content_part in item.content:
-            if isinstance(content_part, TextContent):
-                for segment in content_part.segments:
-                    segment_encoding = self.tokenizer.encode(segment.text, add_special_tokens=False)
-                    all_input_ids.extend(segment_encoding.ids)
-                    if segment.learnable and is_assistant_turn:
-                        all_labels.extend(segment_encoding.ids)
-                    else:
-                        all_labels.extend([ignore] * len(segment_encoding.ids))
-
-            elif isinstance(content_part, ReasoningContent):
-                if self.config.include_reasoning:
-                    think_start_encoding = self.tokenizer.encode(self.tokens.think_start, add_special_tokens=False)
-                    all_input_ids.extend(think_start_encoding.ids)
-                    all_labels.extend(think_start_encoding.ids)
-
-                    for segment in content_part.segments:
-                        segment_encoding = self.tokenizer.encode(segment.text, add_special_tokens=False)
-                        all_input_ids.extend(segment_encoding.ids)
-                        if segment.learnable:
-                            all_labels.extend(segment_encoding.ids)
-                        else:
-                            all_labels.extend([ignore] * len(segment_encoding.ids))
-
-                    think_end_encoding = self.tokenizer.encode(self.tokens.think_end + "\n", add_special_tokens=False)
-                    all_input_ids.extend(think_end_encoding.ids)
-                    all_labels.extend(think_end_encoding.ids)
-
-            elif isinstance(content_part, ToolCallContent):
-                tcall_str = self._serialize_tool_calls(content_part) + "\n"
-                tcall_encoding = self.tokenizer.encode(tcall_str, add_special_tokens=False)
-                all_input_ids.extend(tcall_encoding.ids)
-                all_labels.extend(tcall_encoding.ids)
-
-            elif isinstance(content_part, ToolsContent):
-                tools_str = self._serialize_tools(content_part) + "\n"
-                tools_encoding = self.tokenizer.encode(tools_str, add_special_tokens=False)
-                all_input_ids.extend(tools_encoding.ids)
-                all_labels.extend([ignore] * len(tools_encoding.ids))
-
-            elif isinstance(content_part, ToolResultsContent):
-                tresults_str = self._serialize_tool_results(content_part) + "\n"
-                tresults_encoding = self.tokenizer.encode(tresults_str, add_special_tokens=False)
-                all_input_ids.extend(tresults_encoding.ids)
-                all_labels.extend([ignore] * len(tresults_encoding.ids))
-
-        eot_encoding = self.tokenizer.encode(self.tokens.eot, add_special_tokens=False)
-        all_input_ids.extend(eot_encoding.ids)
-        if is_assistant_turn:
-            all_labels.extend(eot_encoding.ids)  # assistant should know when to stop yapping
-        else:
-            all_labels.extend([ignore] * len(eot_encoding.ids))
+    def _collect_text(self, content_part: TextContent, fragments: List[Fragment], learnable: List[bool], is_assistant_turn: bool):
+        self._collect_segments(content_part.segments, fragments, learnable, is_assistant_turn)
+
+    def _collect_reasoning(self, content_part: ReasoningContent, fragments: List[Fragment], learnable: List[bool], is_assistant_turn: bool):
+        if not self.config.include_reasoning:
+            return
+        fragments.append(self._think_start_ids)
+        learnable.append(True)
+
+        self._collect_segments(content_part.segments, fragments, learnable, True)
+
+        fragments.append(self._think_end_nl_ids)
+        learnable.append(True)
+
+    def _collect_tool_calls(self, content_part: ToolCallContent, fragments: List[Fragment], learnable: List[bool], is_assistant_turn: bool):
+        fragments.append(self._serialize_tool_calls(content_part) + "\n")
+        learnable.append(True)
+
+    def _collect_tools(self, content_part: ToolsContent, fragments: List[Fragment], learnable: List[bool], is_assistant_turn: bool):
+        fragments.append(self._serialize_tools(content_part) + "\n")
+        learnable.append(False)
+
+    def _collect_tool_results(self, content_part: ToolResultsContent, fragments: List[Fragment], learnable: List[bool], is_assistant_turn: bool):
+        fragments.append(self._serialize_tool_results(content_part) + "\n")
+        learnable.append(False)
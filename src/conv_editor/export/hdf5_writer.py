@@ -1,6 +1,6 @@
 import logging
 from pathlib import Path
-from typing import Dict
+from typing import Dict, List, Optional
 
 import h5py
 import numpy as np
@@ -8,33 +8,72 @@ import numpy as np
 logger = logging.getLogger(__name__)
 
 
+def select_token_dtype(vocab_size: int, ignore_index: int = -100, store_labels_as_mask: bool = False) -> np.dtype:
+    # Labels share the ids' dtype, so the ignore index has to fit too unless labels are stored as a mask.
+    if store_labels_as_mask:
+        return np.dtype(np.uint16) if vocab_size <= 2**16 else np.dtype(np.int32)
+    info = np.iinfo(np.int16)
+    if vocab_size <= 2**15 and info.min <= ignore_index <= info.max:
+        return np.dtype(np.int16)
+    return np.dtype(np.int32)
+
+
 class HDF5Writer:
-    def __init__(self, filepath: Path, chunk_size: int = 2048):
+    def __init__(
+        self,
+        filepath: Path,
+        chunk_size: int = 2048,
+        row_chunk: int = 64,
+        compression: Optional[str] = None,
+        dtype: np.dtype = np.int32,
+        store_labels_as_mask: bool = False,
+        ignore_index: int = -100,
+    ):
         self.filepath = filepath
         self.chunk_size = chunk_size
+        self.row_chunk = row_chunk
+        self.dtype = np.dtype(dtype)
+        # With a mask, labels are rebuilt at load time as where(mask, input_ids, ignore_index).
+        self.store_labels_as_mask = store_labels_as_mask
+        self.ignore_index = ignore_index
+        self._labels_name = "mask" if store_labels_as_mask else "labels"
+        # HDF5 filters only see the per-row vlen descriptors, not the token payload (that lives in the global heap),
+        # so compression barely changes file size for this layout and stays off unless asked for.
+        self.compression = compression
         self.file = None
         self.size = 0
+        # Rows are held back until they add up to at least `chunk_size` tokens or fill a `row_chunk`-row HDF5 chunk,
+        # and are then written with one resize per dataset.
+        self._pending_ids: List[np.ndarray] = []
+        self._pending_labels: List[np.ndarray] = []
+        self._pending_tokens = 0
 
     def __enter__(self):
         try:
             self.file = h5py.File(self.filepath, "w")
-            vlen_dtype = h5py.special_dtype(vlen=np.int32)
+            labels_dtype = np.uint8 if self.store_labels_as_mask else self.dtype
 
             self.file.create_dataset(
                 "input_ids",
                 shape=(0,),
                 maxshape=(None,),
-                dtype=vlen_dtype,
-                chunks=(1,),
+                dtype=h5py.vlen_dtype(self.dtype),
+                chunks=(self.row_chunk,),
+                compression=self.compression,
+                shuffle=self.compression is not None,
             )
             self.file.create_dataset(
-                "labels",
+                self._labels_name,
                 shape=(0,),
                 maxshape=(None,),
-                dtype=vlen_dtype,
-                chunks=(1,),
+                dtype=h5py.vlen_dtype(labels_dtype),
+                chunks=(self.row_chunk,),
+                compression=self.compression,
+                shuffle=self.compression is not None,
             )
-            logger.info(f"Opened HDF5 file for writing at {self.filepath}")
+            if self.store_labels_as_mask:
+                self.file.attrs["ignore_index"] = self.ignore_index
+            logger.info(f"Opened HDF5 file for writing at {self.filepath} ({self.dtype} ids, {self.row_chunk} rows per HDF5 chunk)")
             return self
         except Exception as e:
             logger.error(f"Failed to create or open HDF5 file {self.filepath}: {e}")
@@ -57,17 +96,43 @@ class HDF5Writer:
         if len(input_ids) == 0:
             return
 
-        new_size = self.size + 1
-        self.file["input_ids"].resize((new_size,))
-        self.file["labels"].resize((new_size,))
+        if self.dtype.itemsize < 4:
+            info = np.iinfo(self.dtype)
+            if input_ids.min() < info.min or input_ids.max() > info.max:
+                raise ValueError(f"Token ids out of range for {self.dtype}: [{input_ids.min()}, {input_ids.max()}].")
+
+        self._pending_ids.append(np.ascontiguousarray(input_ids, dtype=self.dtype))
+        if self.store_labels_as_mask:
+            self._pending_labels.append((labels != self.ignore_index).view(np.uint8))
+        else:
+            self._pending_labels.append(np.ascontiguousarray(labels, dtype=self.dtype))
+        self._pending_tokens += len(input_ids)
+        if self._pending_tokens >= self.chunk_size or len(self._pending_ids) >= self.row_chunk:
+            self.flush()
+
+    def flush(self):
+        if not self.file or not self._pending_ids:
+            return
 
-        self.file["input_ids"][self.size] = input_ids
-        self.file["labels"][self.size] = labels
+        count = len(self._pending_ids)
+        new_size = self.size + count
+        for name, rows in (("input_ids", self._pending_ids), (self._labels_name, self._pending_labels)):
+            block = np.empty(count, dtype=object)
+            for i, row in enumerate(rows):
+                block[i] = row
+            dset = self.file[name]
+            dset.resize((new_size,))
+            # write_direct hands the object array to HDF5 as-is; slice assignment would try to stack equal-length rows into 2D.
+            dset.write_direct(block, dest_sel=np.s_[self.size : new_size])
 
         self.size = new_size
+        self._pending_ids = []
+        self._pending_labels = []
+        self._pending_tokens = 0
 
     def close(self):
         if self.file:
+            self.flush()
             logger.info(f"Closing HDF5 file. Total conversations (rows) written: {self.size}")
             self.file.close()
             self.file = None
@@ -0,0 +1,60 @@
+import logging
+import multiprocessing
+import os
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from itertools import islice
+from typing import Deque, Dict, Iterable, Iterator, List, Optional
+
+import numpy as np
+from tokenizers import Tokenizer
+
+from conv_editor.core.models import ConversationData
+from conv_editor.export.config import ExportConfig
+from conv_editor.export.exporter import TrainingExporter
+
+logger = logging.getLogger(__name__)
+
+_worker_exporter: Optional[TrainingExporter] = None
+
+
+def _init_worker(config: ExportConfig):
+    global _worker_exporter
+    # Each process owns one tokenizer; letting every one of them spin up its own rayon pool would oversubscribe the cores.
+    os.environ["TOKENIZERS_PARALLELISM"] = "false"
+    tokenizer = Tokenizer.from_file(str(config.tokenizer_path))
+    _worker_exporter = TrainingExporter(tokenizer, config)
+
+
+def _process_chunk(conversations: List[ConversationData]) -> List[Dict[str, np.ndarray]]:
+    return list(_worker_exporter.process_many(conversations))
+
+
+class ParallelExporter:
+    def __init__(self, config: ExportConfig, max_workers: Optional[int] = None, chunk_size: int = 256):
+        self.config = config
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.chunk_size = chunk_size
+
+    def process_many(self, conversations: Iterable[ConversationData]) -> Iterator[Dict[str, np.ndarray]]:
+        # spawn rather than fork: the caller is usually a QThread inside a running Qt application.
+        pool = ProcessPoolExecutor(
+            max_workers=self.max_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(self.config,),
+        )
+        logger.info(f"Started {self.max_workers} tokenizer processes for export.")
+
+        pending: Deque[Future] = deque()
+        it = iter(conversations)
+        try:
+            while chunk := list(islice(it, self.chunk_size)):
+                pending.append(pool.submit(_process_chunk, chunk))
+                # Keep a couple of chunks queued per worker, but no more, so memory stays bounded and output stays in order.
+                if len(pending) >= 2 * self.max_workers:
+                    yield from pending.popleft().result()
+            while pending:
+                yield from pending.popleft().result()
+        finally:
+            pool.shutdown(wait=True, cancel_futures=True)
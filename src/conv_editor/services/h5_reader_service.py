@@ -1,8 +1,10 @@
 import logging
+import threading
 from pathlib import Path
 from typing import List, Optional, Tuple
 
 import h5py
+import numpy as np
 from tokenizers import Tokenizer
 
 logger = logging.getLogger(__name__)
@@ -15,6 +17,9 @@ class H5ReaderService:
         self.tokenizer: Optional[Tokenizer] = None
         self.h5_file: Optional[h5py.File] = None
         self._conversation_count = 0
+        self._labels_name = "labels"
+        # Rows may be read from a background thread (e.g. prefetching) while the UI thread reads or closes the file.
+        self._lock = threading.Lock()
 
     def __enter__(self):
         self.load()
@@ -37,7 +42,8 @@ class H5ReaderService:
             raise ValueError(f"Could not load tokenizer file: {e}") from e
 
         try:
-            self.h5_file = h5py.File(self.h5_path, "r")
+            # SWMR read mode also works on files that a SWMR writer is still appending to.
+            self.h5_file = h5py.File(self.h5_path, "r", libver="latest", swmr=True)
             logger.info(f"Successfully opened HDF5 file: {self.h5_path}")
         except Exception as e:
             logger.error(f"Failed to open HDF5 file: {e}")
@@ -49,15 +55,20 @@ class H5ReaderService:
         if self.h5_file is None:
             raise IOError("HDF5 file is not open.")
 
-        required_datasets = ["input_ids", "labels"]
-        for ds_name in required_datasets:
-            if ds_name not in self.h5_file:
-                raise ValueError(f"HDF5 file is missing required dataset: '{ds_name}'")
+        if "input_ids" not in self.h5_file:
+            raise ValueError("HDF5 file is missing required dataset: 'input_ids'")
+        # Files written with store_labels_as_mask carry a uint8 'mask' dataset in place of 'labels'.
+        if "labels" in self.h5_file:
+            self._labels_name = "labels"
+        elif "mask" in self.h5_file:
+            self._labels_name = "mask"
+        else:
+            raise ValueError("HDF5 file is missing required dataset: 'labels'")
 
-        if len(self.h5_file["input_ids"]) != len(self.h5_file["labels"]):
-            raise ValueError("Datasets 'input_ids' and 'labels' have mismatched lengths.")
+        if len(self.h5_file["input_ids"]) != len(self.h5_file[self._labels_name]):
+            raise ValueError(f"Datasets 'input_ids' and '{self._labels_name}' have mismatched lengths.")
 
-        self._conversation_count = len(self.h5_file["input_ids"])
+        self._conversation_count = self.h5_file["input_ids"].shape[0]
         logger.info(f"HDF5 file validation successful. Found {self._conversation_count} conversations.")
 
     @property
@@ -70,34 +81,34 @@ class H5ReaderService:
         if self.h5_file is None or self.tokenizer is None:
             raise IOError("Service is not loaded. Use within a 'with' statement.")
 
-        input_ids = self.h5_file["input_ids"][index]
-        labels = self.h5_file["labels"][index]
+        with self._lock:
+            if self.h5_file is None:
+                raise IOError("Service is not loaded. Use within a 'with' statement.")
+            input_ids = self._read_row("input_ids", index)
+            labels = self._read_row(self._labels_name, index)
 
         if len(input_ids) == 0:
             return []
 
-        processed_segments = []
-        start_idx = 0
-        current_is_learnable = labels[0] != -100
+        # Runs of equal learnability are found in one vectorized pass; only the run boundaries are visited in Python.
+        mask = labels.astype(bool) if self._labels_name == "mask" else labels != -100
+        switches = np.flatnonzero(np.diff(mask.view(np.int8))) + 1
+        starts = np.concatenate(([0], switches))
+        ends = np.concatenate((switches, [len(mask)]))
 
-        for i in range(1, len(labels)):
-            is_learnable = labels[i] != -100
-            if is_learnable != current_is_learnable:
-                token_ids_segment = input_ids[start_idx:i]
-                text = self.tokenizer.decode(token_ids_segment.tolist(), skip_special_tokens=False)
-                processed_segments.append((text, current_is_learnable))
+        ids = input_ids.tolist()
+        texts = self.tokenizer.decode_batch([ids[start:end] for start, end in zip(starts.tolist(), ends.tolist())], skip_special_tokens=False)
+        return list(zip(texts, mask[starts].tolist()))
 
-                start_idx = i
-                current_is_learnable = is_learnable
-
-        final_token_ids_segment = input_ids[start_idx:]
-        final_text = self.tokenizer.decode(final_token_ids_segment.tolist(), skip_special_tokens=False)
-        processed_segments.append((final_text, current_is_learnable))
-
-        return processed_segments
+    def _read_row(self, name: str, index: int) -> np.ndarray:
+        # Reading into a one-element object array skips h5py's generic indexing and returns the row's array.
+        row = np.empty(1, dtype=object)
+        self.h5_file[name].read_direct(row, np.s_[index : index + 1])
+        return row[0]
 
     def close(self):
-        if self.h5_file:
-            self.h5_file.close()
-            logger.info(f"Closed HDF5 file: {self.h5_path}")
-            self.h5_file = None
+        with self._lock:
+            if self.h5_file:
+                self.h5_file.close()
+                logger.info(f"Closed HDF5 file: {self.h5_path}")
+                self.h5_file = None
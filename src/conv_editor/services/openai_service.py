@@ -4,13 +4,14 @@ from typing import Dict, Iterator, List
 
 from openai import OpenAI, OpenAIError
 
-from conv_editor.config.settings import settings
+from conv_editor.config.settings import get_settings
 
 logger = logging.getLogger(__name__)
 
 
 class OpenAIService:
     def __init__(self):
+        settings = get_settings()
         self.model = settings.OPENAI_MODEL_NAME
         self._lock = threading.Lock()
         self._is_running = False
@@ -49,11 +50,17 @@ class OpenAIService:
                 if not self._is_running:
                     logger.info("Chat stream stopped by user.")
                     break
-                if chunk.choices:
-                    if hasattr(chunk.choices[0].delta, "reasoning_content") and chunk.choices[0].delta.reasoning_content is not None:
-                        yield chunk.choices[0].delta.reasoning_content
-                    elif chunk.choices[0].delta.content is not None:
-                        yield chunk.choices[0].delta.content
+                choices = chunk.choices
+                if not choices:
+                    continue
+                delta = choices[0].delta
+                reasoning = getattr(delta, "reasoning_content", None)
+                if reasoning is not None:
+                    yield reasoning
+                    continue
+                content = delta.content
+                if content is not None:
+                    yield content
         except OpenAIError as e:
             logger.error(f"OpenAI API error during chat stream: {e}")
             raise
@@ -74,10 +81,15 @@ class OpenAIService:
                 if not self._is_running:
                     logger.info("Completion stream stopped by user.")
                     break
-                if not chunk.choices and hasattr(chunk, "content"):
-                    yield chunk.content
-                elif chunk.choices and chunk.choices[0].delta.content is not None:
-                    yield chunk.choices[0].delta.content
+                choices = chunk.choices
+                if not choices:
+                    content = getattr(chunk, "content", None)
+                    if content is not None:
+                        yield content
+                    continue
+                content = choices[0].delta.content
+                if content is not None:
+                    yield content
         except OpenAIError as e:
             logger.error(f"OpenAI API error during Completion stream: {e}")
             raise
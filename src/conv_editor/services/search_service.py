@@ -1,45 +1,118 @@
 import json
 import logging
+import os
+import re
+import threading
+from collections import OrderedDict, deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Iterator, List, Optional, Tuple
+from typing import Callable, Deque, Dict, Iterator, List, Optional, Tuple, Union
 
-from rapidfuzz import fuzz, utils
+import numpy as np
+from rapidfuzz import fuzz, process, utils
 
 from conv_editor.core.models import SearchMatch
 
 logger = logging.getLogger(__name__)
 
+try:
+    import orjson
+    from orjson import loads as _loads
+
+    def _dumps_pretty(data) -> str:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode("utf-8")
+
+except ImportError:
+    _loads = json.loads
+
+    def _dumps_pretty(data) -> str:
+        return json.dumps(data, indent=2, ensure_ascii=False)
+
+
+class _CachedFile:
+    __slots__ = ("raw", "lines", "_conversation", "_parsed", "_pretty")
+
+    def __init__(self, raw: bytes):
+        self.raw = raw
+        self.lines = self._split_lines(raw)
+        self._conversation: Optional[List[Dict]] = None
+        self._parsed = False
+        self._pretty: Optional[str] = None
+
+    @staticmethod
+    def _split_lines(raw: bytes) -> List[str]:
+        lines = raw.decode("utf-8").split("\n")
+        if lines[-1] == "":
+            lines.pop()
+        return [line.rstrip("\r") for line in lines]
+
+    @property
+    def conversation(self) -> Optional[List[Dict]]:
+        if not self._parsed:
+            self._conversation = SearchService._load_conversation_safe(self.raw)
+            self._parsed = True
+        return self._conversation
+
+    @property
+    def pretty(self) -> Optional[str]:
+        # Conversations are saved with a two-space indent, so the file text is usually the preview as-is;
+        # anything else is pretty-printed once here, off the UI thread, and shared by every match in the file.
+        if self._pretty is None and self.conversation is not None:
+            text = self.raw.decode("utf-8")
+            self._pretty = text if text.startswith("[\n  ") or text == "[]" else _dumps_pretty(self.conversation)
+        return self._pretty
+
 
 class SearchService:
+    # Shared by every instance (each search runs on a fresh one) so repeated searches over an unchanged
+    # directory skip reading, decoding and parsing; entries are keyed by path and checked against mtime/size.
+    # The cache is bounded by the total size of the raw files it holds (lines, parsed data and previews grow with it).
+    CACHE_BYTES = 64 * 1024 * 1024
+    _cache: "OrderedDict[str, Tuple[Tuple[int, int], _CachedFile]]" = OrderedDict()
+    _cache_bytes = 0
+    _cache_lock = threading.Lock()
+
     def fuzzy_search(self, root_dir: str, query: str, score_cutoff: int) -> Iterator[SearchMatch]:
         root_path = Path(root_dir)
         if not query or not root_path.is_dir():
             return
 
         logger.info(f"Starting fuzzy search for '{query}' in {root_path}")
-        for json_path in root_path.rglob("*.json"):
+
+        def search_file(json_path: Path) -> List[SearchMatch]:
             try:
-                file_content = json_path.read_text(encoding="utf-8")
-                lines = file_content.splitlines()
-                conversation_data = None  # Lazy load
-
-                for line_idx, line in enumerate(lines):
-                    score = fuzz.partial_ratio(query, line, processor=utils.default_process)
-                    if score >= score_cutoff:
-                        indices = self._find_best_match_indices(line, query)
-                        if conversation_data is None:
-                            conversation_data = self._load_conversation_safe(file_content)
-
-                        item_idx = self._find_item_index_fuzzy(conversation_data, line, indices)
-                        yield SearchMatch(
-                            file_path=str(json_path.resolve()),
-                            preview=line,
-                            match_indices=indices,
-                            item_index=item_idx,
-                            score=score,
-                        )
+                cached = self._get(json_path)
+                return self._fuzzy_search_file(json_path, cached, query, score_cutoff) if cached else []
             except Exception as e:
                 logger.warning(f"Could not process file '{json_path}' for search: {e}")
+                return []
+
+        yield from self._search_files(root_path, search_file)
+
+    def _fuzzy_search_file(self, json_path: Path, cached: _CachedFile, query: str, score_cutoff: int) -> List[SearchMatch]:
+        lines = cached.lines
+        if not lines:
+            return []
+        # Score the whole file in one call; only the lines that clear the cutoff are looked at again in Python.
+        # Passing the cutoff lets rapidfuzz abandon a line as soon as it cannot reach it (those score 0).
+        scores = process.cdist([query], lines, scorer=fuzz.partial_ratio, processor=utils.default_process, dtype=np.float64, score_cutoff=score_cutoff)[0]
+
+        matches = []
+        for line_idx in np.flatnonzero(scores >= score_cutoff).tolist():
+            line = lines[line_idx]
+            indices = self._find_best_match_indices(line, query)
+            item_idx = self._find_item_index_fuzzy(cached.conversation, line, indices)
+            matches.append(
+                SearchMatch(
+                    file_path=str(json_path.resolve()),
+                    preview=line,
+                    match_indices=indices,
+                    item_index=item_idx,
+                    score=float(scores[line_idx]),
+                    pretty_preview=cached.pretty,
+                )
+            )
+        return matches
 
     def exact_search(self, root_dir: str, query: str, case_insensitive: bool) -> Iterator[SearchMatch]:
         root_path = Path(root_dir)
@@ -47,61 +120,113 @@ class SearchService:
             return
 
         logger.info(f"Starting exact search for '{query}' in {root_path}")
-        search_query = query.lower() if case_insensitive else query
+        # One compiled pattern serves every line of every file.
+        pattern = re.compile(re.escape(query), re.IGNORECASE if case_insensitive else 0)
+        # A case-sensitive query can rule out a whole file with a single byte search of its contents.
+        query_bytes = None if case_insensitive else query.encode("utf-8")
 
-        for json_path in root_path.rglob("*.json"):
+        def search_file(json_path: Path) -> List[SearchMatch]:
             try:
-                file_content = json_path.read_text(encoding="utf-8")
-                lines = file_content.splitlines()
-                conversation_data = None  # Lazy load
-
-                for line_idx, line in enumerate(lines):
-                    search_line = line.lower() if case_insensitive else line
-                    if search_query in search_line:
-                        indices = self._find_exact_indices(line, query, case_insensitive)
-                        if conversation_data is None:
-                            conversation_data = self._load_conversation_safe(file_content)
-
-                        item_idx = self._find_item_index_exact(conversation_data, line, indices, case_insensitive)
-                        yield SearchMatch(
-                            file_path=str(json_path.resolve()),
-                            preview=line,
-                            match_indices=indices,
-                            item_index=item_idx,
-                            score=100,
-                        )
+                cached = self._get(json_path)
+                if not cached or (query_bytes is not None and cached.raw.find(query_bytes) == -1):
+                    return []
+                return self._exact_search_file(json_path, cached, pattern)
             except Exception as e:
                 logger.warning(f"Could not process file '{json_path}' for search: {e}")
+                return []
+
+        yield from self._search_files(root_path, search_file)
+
+    def _exact_search_file(self, json_path: Path, cached: _CachedFile, pattern: re.Pattern) -> List[SearchMatch]:
+        matches = []
+        item_idx: Optional[int] = None
+        for line in cached.lines:
+            match = pattern.search(line)
+            if match:
+                indices = match.span()
+                if not matches:
+                    # Every hit matches the same query text, so the owning item is looked up once per file.
+                    item_idx = self._find_item_index_exact(cached.conversation, pattern)
+                matches.append(
+                    SearchMatch(
+                        file_path=str(json_path.resolve()),
+                        preview=line,
+                        match_indices=indices,
+                        item_index=item_idx,
+                        score=100,
+                        pretty_preview=cached.pretty,
+                    )
+                )
+        return matches
 
     @staticmethod
-    def _load_conversation_safe(content: str) -> Optional[List[Dict]]:
+    def _search_files(root_path: Path, search_file: Callable[[Path], List[SearchMatch]]) -> Iterator[SearchMatch]:
+        # Files are searched concurrently (file I/O and rapidfuzz release the GIL), but results are yielded in file order.
+        workers = os.cpu_count() or 1
+        executor = ThreadPoolExecutor(max_workers=workers)
+        pending: Deque[Future] = deque()
         try:
-            data = json.loads(content)
+            # Only a bounded window of files is in flight, so the first matches arrive while the walk is still going
+            # instead of after every path has been listed and queued.
+            for json_path in root_path.rglob("*.json"):
+                pending.append(executor.submit(search_file, json_path))
+                if len(pending) >= 4 * workers:
+                    yield from pending.popleft().result()
+            while pending:
+                yield from pending.popleft().result()
+        finally:
+            # The consumer may stop early (max results, cancel); drop the files that have not been started.
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    @classmethod
+    def _get(cls, json_path: Path) -> Optional[_CachedFile]:
+        stat = json_path.stat()
+        if stat.st_size == 0:
+            return None
+        key = str(json_path)
+        stamp = (stat.st_mtime_ns, stat.st_size)
+
+        with cls._cache_lock:
+            hit = cls._cache.get(key)
+            if hit is not None and hit[0] == stamp:
+                cls._cache.move_to_end(key)
+                return hit[1]
+
+        cached = _CachedFile(json_path.read_bytes())
+        size = len(cached.raw)
+        with cls._cache_lock:
+            old = cls._cache.pop(key, None)
+            if old is not None:
+                cls._cache_bytes -= len(old[1].raw)
+            if size <= cls.CACHE_BYTES:
+                cls._cache[key] = (stamp, cached)
+                cls._cache_bytes += size
+                while cls._cache_bytes > cls.CACHE_BYTES:
+                    _, (_, evicted) = cls._cache.popitem(last=False)
+                    cls._cache_bytes -= len(evicted.raw)
+        return cached
+
+    @staticmethod
+    def _load_conversation_safe(content: Union[str, bytes]) -> Optional[List[Dict]]:
+        try:
+            data = _loads(content)
             return data if isinstance(data, list) else None
         except json.JSONDecodeError:
             return None
 
     @staticmethod
     def _find_best_match_indices(line: str, query: str, min_ratio: int = 60) -> Optional[Tuple[int, int]]:
-        q_len, l_len = len(query), len(line)
-        if not q_len or not l_len:
+        processed_query = utils.default_process(query)
+        if not processed_query or not line:
             return None
 
-        best_score, best_indices = -1, None
-        for i in range(max(0, l_len - q_len + 1)):
-            substring = line[i : i + q_len]
-            score = fuzz.ratio(query, substring, processor=utils.default_process)
-            if score > best_score:
-                best_score, best_indices = score, (i, i + q_len)
-
-        return best_indices if best_score >= min_ratio and best_indices else None
-
-    @staticmethod
-    def _find_exact_indices(line: str, query: str, case_insensitive: bool) -> Optional[Tuple[int, int]]:
-        search_line = line.lower() if case_insensitive else line
-        search_query = query.lower() if case_insensitive else query
-        start_idx = search_line.find(search_query)
-        return (start_idx, start_idx + len(query)) if start_idx != -1 else None
+        # default_process maps characters one-to-one apart from trimming the ends; the sentinel keeps the
+        # leading edge from being trimmed so alignment offsets index straight into `line`.
+        processed_line = utils.default_process("a" + line)[1:]
+        alignment = fuzz.partial_ratio_alignment(processed_query, processed_line)
+        if alignment is None or alignment.score < min_ratio:
+            return None
+        return alignment.dest_start, alignment.dest_end
 
     @staticmethod
     def _find_item_index_fuzzy(conversation: Optional[List[Dict]], line: str, indices: Optional[Tuple[int, int]]) -> Optional[int]:
@@ -126,26 +251,14 @@ class SearchService:
         return None
 
     @staticmethod
-    def _find_item_index_exact(
-        conversation: Optional[List[Dict]],
-        line: str,
-        indices: Optional[Tuple[int, int]],
-        case_insensitive: bool,
-    ) -> Optional[int]:
-        if not conversation or not indices:
+    def _find_item_index_exact(conversation: Optional[List[Dict]], pattern: re.Pattern) -> Optional[int]:
+        if not conversation:
             return None
 
-        matched_text = line[indices[0] : indices[1]]
-        if not matched_text:
-            return None
-
-        search_matched_text = matched_text.lower() if case_insensitive else matched_text
-
         for idx, item in enumerate(conversation):
             if "content" in item and isinstance(item["content"], list):
                 for content_part in item["content"]:
                     if "text" in content_part and isinstance(content_part["text"], str):
-                        search_text = content_part["text"].lower() if case_insensitive else content_part["text"]
-                        if search_matched_text in search_text:
+                        if pattern.search(content_part["text"]):
                             return idx
         return None
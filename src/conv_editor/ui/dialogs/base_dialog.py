@@ -1,16 +1,16 @@
 import logging
-from typing import TYPE_CHECKING, Union
+from typing import TYPE_CHECKING, List, Union
 
-from PySide6.QtCore import Slot
+from PySide6.QtCore import QTimer, Slot
 from PySide6.QtGui import QCloseEvent, QTextCursor
 from PySide6.QtWidgets import (
     QDialog,
     QHBoxLayout,
+    QPlainTextEdit,
     QProgressBar,
     QPushButton,
     QSizePolicy,
     QSpacerItem,
-    QTextEdit,
     QVBoxLayout,
     QWidget,
 )
@@ -23,6 +23,9 @@ logger = logging.getLogger(__name__)
 
 
 class BaseGenerationDialog(QDialog):
+    MAX_BLOCK_COUNT = 100_000
+    LARGE_FLUSH_CHARS = 16_384
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setMinimumSize(600, 500)
@@ -33,11 +36,24 @@ class BaseGenerationDialog(QDialog):
         self._stopped_manually = False
         self._has_error = False
 
+        # Streamed chunks are buffered and written to the document in one insert per timer tick.
+        self._pending_chunks: List[str] = []
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setInterval(33)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.timeout.connect(self._flush_chunks)
+
         layout = QVBoxLayout(self)
 
-        self.display_area = QTextEdit()
+        # Plain-text layout is line based and stays cheap as streamed output grows; the block cap bounds runaway generations.
+        self.display_area = QPlainTextEdit()
         self.display_area.setReadOnly(True)
+        self.display_area.setMaximumBlockCount(self.MAX_BLOCK_COUNT)
+        # Nobody undoes streamed tokens, and every insert would otherwise push an undo entry.
+        self.display_area.setUndoRedoEnabled(False)
         layout.addWidget(self.display_area)
+        # Inserting through a private cursor leaves the widget's own cursor and selection untouched.
+        self._end_cursor = QTextCursor(self.display_area.document())
 
         self.progress_bar = QProgressBar()
         self.progress_bar.setRange(0, 0)
@@ -75,6 +91,7 @@ class BaseGenerationDialog(QDialog):
         self.setWindowTitle("Generating...")
         self._stopped_manually = False
         self._has_error = False
+        self.display_area.setUndoRedoEnabled(False)
         self.progress_bar.setVisible(True)
         self.stop_button.setEnabled(True)
         self.close_button.setEnabled(False)
@@ -88,11 +105,38 @@ class BaseGenerationDialog(QDialog):
 
     @Slot(str)
     def _on_generation_progress(self, text_chunk: str):
-        self.display_area.moveCursor(QTextCursor.MoveOperation.End)
-        self.display_area.insertPlainText(text_chunk)
+        self._pending_chunks.append(text_chunk)
+        if not self._flush_timer.isActive():
+            self._flush_timer.start()
+
+    @Slot()
+    def _flush_chunks(self):
+        self._flush_timer.stop()
+        if not self._pending_chunks:
+            return
+        text = "".join(self._pending_chunks)
+        self._pending_chunks.clear()
+        scrollbar = self.display_area.verticalScrollBar()
+        at_bottom = scrollbar.value() >= scrollbar.maximum()
+        # Large flushes (e.g. after the window was hidden) also hold back repaints until the text is in.
+        suspend_updates = len(text) >= self.LARGE_FLUSH_CHARS
+        if suspend_updates:
+            self.display_area.setUpdatesEnabled(False)
+        # One edit block per flush, so the document lays out the inserted text once.
+        self._end_cursor.beginEditBlock()
+        self._end_cursor.movePosition(QTextCursor.MoveOperation.End)
+        self._end_cursor.insertText(text)
+        self._end_cursor.endEditBlock()
+        if at_bottom:
+            scrollbar.setValue(scrollbar.maximum())
+        if suspend_updates:
+            self.display_area.setUpdatesEnabled(True)
 
     @Slot()
     def _on_generation_finished(self):
+        self._flush_chunks()
+        # Editable dialogs get undo back for the user's own edits between generations.
+        self.display_area.setUndoRedoEnabled(not self.display_area.isReadOnly())
         self.progress_bar.setVisible(False)
         self.stop_button.setEnabled(False)
         self.close_button.setEnabled(True)
@@ -107,7 +151,8 @@ class BaseGenerationDialog(QDialog):
     @Slot(str)
     def _on_generation_error(self, error_message: str):
         self._has_error = True
-        self.display_area.append(f"\n\n--- ERROR ---\n{error_message}")
+        self._flush_chunks()
+        self.display_area.appendPlainText(f"\n\n--- ERROR ---\n{error_message}")
 
     @Slot()
     def _stop_generation(self):
@@ -0,0 +1,27 @@
+import functools
+import os
+
+from PySide6.QtWidgets import QColorDialog, QFileDialog
+
+from conv_editor.config.settings import get_settings
+
+_STALLING_DESKTOPS = {"gnome", "unity"}
+
+
+@functools.lru_cache(maxsize=1)
+def use_native_dialogs() -> bool:
+    configured = get_settings().APP_USE_NATIVE_DIALOGS
+    if configured is not None:
+        return configured
+    # Portal-backed native pickers on these desktops can stall for hundreds of milliseconds the first time they open.
+    desktops = {name.strip().lower() for name in os.environ.get("XDG_CURRENT_DESKTOP", "").split(":")}
+    uses_portal = "portal" in os.environ.get("QT_QPA_PLATFORMTHEME", "").lower()
+    return not (desktops & _STALLING_DESKTOPS or uses_portal)
+
+
+def file_dialog_options() -> QFileDialog.Option:
+    return QFileDialog.Option(0) if use_native_dialogs() else QFileDialog.Option.DontUseNativeDialog
+
+
+def color_dialog_options() -> QColorDialog.ColorDialogOption:
+    return QColorDialog.ColorDialogOption(0) if use_native_dialogs() else QColorDialog.ColorDialogOption.DontUseNativeDialog
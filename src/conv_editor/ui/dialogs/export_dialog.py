@@ -1,7 +1,8 @@
 import logging
+from functools import partial
 from pathlib import Path
 
-from PySide6.QtCore import QStringListModel, Qt, QTimer, Slot
+from PySide6.QtCore import QObject, QRunnable, QStringListModel, Qt, QThreadPool, QTimer, Signal, Slot
 from PySide6.QtGui import QCloseEvent
 from PySide6.QtWidgets import (
     QCheckBox,
@@ -23,13 +24,34 @@ from PySide6.QtWidgets import (
 from tokenizers import Tokenizer
 
 from conv_editor.export.config import ExportConfig, SpecialTokensConfig
+from conv_editor.ui.dialogs.dialog_options import file_dialog_options
 from conv_editor.workers.export_worker import ExportWorker
 
 logger = logging.getLogger(__name__)
 
 
+class _TokenizerLoadSignals(QObject):
+    finished = Signal(object, object, str)  # path, tokenizer or None, error message
+
+
+class _TokenizerLoadTask(QRunnable):
+    def __init__(self, path: Path):
+        super().__init__()
+        self.path = path
+        self.signals = _TokenizerLoadSignals()
+
+    def run(self):
+        try:
+            tokenizer = Tokenizer.from_file(str(self.path))
+        except Exception as e:
+            self.signals.finished.emit(self.path, None, str(e))
+            return
+        self.signals.finished.emit(self.path, tokenizer, "")
+
+
 class ExportDialog(QDialog):
     DEBOUNCE_MS = 250
+    MAX_LABEL_IDS = 8
 
     def __init__(self, root_dir: str, assistant_name: str, parent=None):
         super().__init__(parent)
@@ -40,10 +62,25 @@ class ExportDialog(QDialog):
         self.assistant_name = assistant_name
         self.tokenizer: Tokenizer | None = None
         self.worker: ExportWorker | None = None
-        self.completer: QCompleter | None = None
+
+        self._completer_model = QStringListModel(self)
+        self.completer = QCompleter(self._completer_model, self)
+        self.completer.setCaseSensitivity(Qt.CaseSensitivity.CaseInsensitive)
+        self.completer.setCompletionMode(QCompleter.CompletionMode.PopupCompletion)
+        # A prefix match over a sorted model lets QCompleter binary-search instead of scanning every added token.
+        self.completer.setFilterMode(Qt.MatchFlag.MatchStartsWith)
+        self.completer.setModelSorting(QCompleter.ModelSorting.CaseInsensitivelySortedModel)
 
         self.token_edits: dict[str, QLineEdit] = {}
         self.token_id_labels: dict[str, QLabel] = {}
+        # Only fields edited since the last debounce flush are re-encoded; encodings are memoised per text.
+        self._dirty_keys: set[str] = set()
+        self._last_text: dict[str, str] = {}
+        self._encode_cache: dict[str, list[int]] = {}
+        self._added_token_ids: dict[str, list[int]] = {}
+        self._last_label_text: dict[str, tuple[str, str]] = {}
+        self._is_ready_cached: bool | None = None
+        self._pending_tokenizer_path: Path | None = None
 
         self.debounce_timer = QTimer(self)
         self.debounce_timer.setSingleShot(True)
@@ -101,6 +138,7 @@ class ExportDialog(QDialog):
             row_layout.addWidget(edit)
             row_layout.addWidget(id_label)
 
+            edit.setCompleter(self.completer)
             self.token_edits[key] = edit
             self.token_id_labels[key] = id_label
             tokens_form_layout.addRow(f"{key}:", row_layout)
@@ -138,26 +176,46 @@ class ExportDialog(QDialog):
         self.start_button.clicked.connect(self._start_or_stop_export)
         self.close_button.clicked.connect(self.reject)
 
-        for edit in self.token_edits.values():
-            edit.textChanged.connect(self.debounce_timer.start)
+        for key, edit in self.token_edits.items():
+            edit.textChanged.connect(partial(self._mark_dirty, key))
         self.debounce_timer.timeout.connect(self._update_token_ids)
 
     @Slot()
     def _browse_tokenizer(self):
-        path, _ = QFileDialog.getOpenFileName(self, "Select Tokenizer", "", "Tokenizer files (*.json)")
+        path, _ = QFileDialog.getOpenFileName(self, "Select Tokenizer", "", "Tokenizer files (*.json)", options=file_dialog_options())
         if path:
             self.tokenizer_path_edit.setText(path)
             self._load_tokenizer(Path(path))
 
     def _load_tokenizer(self, path: Path):
-        try:
-            self.tokenizer = Tokenizer.from_file(str(path))
-            self.status_label.setText(f"Successfully loaded tokenizer with {self.tokenizer.get_vocab_size()} tokens.")
+        # Large tokenizer files take a noticeable time to parse, so loading runs on the thread pool.
+        self._pending_tokenizer_path = path
+        self.status_label.setText(f"Loading tokenizer from {path.name}...")
+        task = _TokenizerLoadTask(path)
+        task.signals.finished.connect(self._on_tokenizer_loaded)
+        QThreadPool.globalInstance().start(task)
+
+    @Slot(object, object, str)
+    def _on_tokenizer_loaded(self, path: Path, tokenizer: Tokenizer | None, error: str):
+        if path != self._pending_tokenizer_path:
+            return
+        self._pending_tokenizer_path = None
+
+        self.tokenizer = tokenizer
+        if tokenizer is not None:
+            self._added_token_ids = {token.content: [token_id] for token_id, token in tokenizer.get_added_tokens_decoder().items()}
+            self.status_label.setText(f"Successfully loaded tokenizer with {tokenizer.get_vocab_size()} tokens.")
             logger.info("Tokenizer loaded successfully.")
-        except Exception as e:
-            self.tokenizer = None
-            QMessageBox.critical(self, "Tokenizer Error", f"Failed to load tokenizer file:\n\n{e}")
-            logger.error(f"Failed to load tokenizer: {e}")
+        else:
+            self._added_token_ids = {}
+            self.status_label.setText("Failed to load tokenizer.")
+            QMessageBox.critical(self, "Tokenizer Error", f"Failed to load tokenizer file:\n\n{error}")
+            logger.error(f"Failed to load tokenizer: {error}")
+
+        # Special tokens are almost always typed verbatim, so their ids are known without calling encode.
+        self._encode_cache = dict(self._added_token_ids)
+        self._last_text.clear()
+        self._dirty_keys.update(self.token_edits)
 
         self._setup_completer()
         self._update_ui_state()
@@ -166,55 +224,77 @@ class ExportDialog(QDialog):
     @Slot()
     def _setup_completer(self):
         if not self.tokenizer:
-            logger.warning("Tokenizer not loaded, cannot setup completer. Clearing existing completers.")
-            if self.completer is not None:
-                for edit in self.token_edits.values():
-                    edit.setCompleter(None)
-                self.completer.deleteLater()
-            self.completer = None
-            return
-
-        special_tokens_list = list(v.content for v in self.tokenizer.get_added_tokens_decoder().values())
+            logger.warning("Tokenizer not loaded, clearing completer suggestions.")
+        self._completer_model.setStringList(sorted(self._added_token_ids, key=str.lower))
 
-        if self.completer is None:
-            self.completer = QCompleter(special_tokens_list, self)
-            self.completer.setCaseSensitivity(Qt.CaseSensitivity.CaseInsensitive)
-            self.completer.setCompletionMode(QCompleter.CompletionMode.PopupCompletion)
-            self.completer.setFilterMode(Qt.MatchFlag.MatchContains)
-
-            for edit in self.token_edits.values():
-                edit.setCompleter(self.completer)
-        else:
-            self.completer.setModel(QStringListModel([]))
+    def _mark_dirty(self, key: str, _text: str = ""):
+        self._dirty_keys.add(key)
+        self.debounce_timer.start()
 
     @Slot()
     def _update_token_ids(self):
+        dirty_keys = self._dirty_keys
+        self._dirty_keys = set()
+
         if not self.tokenizer:
-            for label in self.token_id_labels.values():
-                label.setText("-")
+            for key in dirty_keys:
+                self._set_label(key, "-")
             return
 
-        for key, edit in self.token_edits.items():
-            text = edit.text()
-            label = self.token_id_labels[key]
+        to_encode: list[tuple[str, str]] = []
+        for key in dirty_keys:
+            text = self.token_edits[key].text()
+            if text == self._last_text.get(key):
+                continue
+            self._last_text[key] = text
+
             if not text:
-                label.setText("-")
+                self._set_label(key, "-")
                 continue
 
-            try:
-                encoding = self.tokenizer.encode(text, add_special_tokens=False)
-                if encoding.ids:
-                    label.setText(str(encoding.ids))
-                else:
-                    label.setText("[]")
-                label.setToolTip("")
-            except Exception as e:
-                label.setText("Error")
-                label.setToolTip(f"Could not encode token: {e}")
+            ids = self._encode_cache.get(text)
+            if ids is None:
+                to_encode.append((key, text))
+            else:
+                self._set_token_ids(key, ids)
+
+        if not to_encode:
+            return
+
+        try:
+            encodings = self.tokenizer.encode_batch([text for _, text in to_encode], add_special_tokens=False)
+        except Exception:
+            # Fall back to one call per field so a single bad entry only marks its own row as failed.
+            for key, text in to_encode:
+                try:
+                    ids = self._encode_cache[text] = self.tokenizer.encode(text, add_special_tokens=False).ids
+                    self._set_token_ids(key, ids)
+                except Exception as e:
+                    self._last_text.pop(key, None)
+                    self._set_label(key, "Error", f"Could not encode token: {e}")
+            return
+
+        for (key, text), encoding in zip(to_encode, encodings):
+            self._encode_cache[text] = encoding.ids
+            self._set_token_ids(key, encoding.ids)
+
+    def _set_token_ids(self, key: str, ids: list[int]):
+        if len(ids) > self.MAX_LABEL_IDS:
+            self._set_label(key, f"[{ids[0]}, {ids[1]}, …, {ids[-1]}] ({len(ids)})", str(ids))
+        else:
+            self._set_label(key, str(ids))
+
+    def _set_label(self, key: str, text: str, tooltip: str = ""):
+        if self._last_label_text.get(key) == (text, tooltip):
+            return
+        self._last_label_text[key] = (text, tooltip)
+        label = self.token_id_labels[key]
+        label.setText(text)
+        label.setToolTip(tooltip)
 
     @Slot()
     def _browse_output(self):
-        path, _ = QFileDialog.getSaveFileName(self, "Save Export File", "", "HDF5 files (*.h5)")
+        path, _ = QFileDialog.getSaveFileName(self, "Save Export File", "", "HDF5 files (*.h5)", options=file_dialog_options())
         if path:
             self.output_path_edit.setText(path)
 
@@ -275,7 +355,10 @@ class ExportDialog(QDialog):
             QMessageBox.critical(self, "Export Error", message)
 
     def _update_ui_state(self):
-        is_ready = bool(self.tokenizer_path_edit.text() and self.output_path_edit.text())
+        is_ready = bool(self.tokenizer_path_edit.text()) and bool(self.output_path_edit.text())
+        if is_ready == self._is_ready_cached:
+            return
+        self._is_ready_cached = is_ready
         self.start_button.setEnabled(is_ready)
 
     def _set_running_state(self, is_running: bool):
@@ -290,6 +373,8 @@ class ExportDialog(QDialog):
             if self.worker:
                 self.worker.deleteLater()
             self.worker = None
+            # The button was just force-enabled, so the cached state no longer reflects it.
+            self._is_ready_cached = None
             self._update_ui_state()
         else:
             self.start_button.setText("Stop")
@@ -1,4 +1,4 @@
-from typing import Dict, List
+from typing import Dict, List, Optional, Tuple
 
 from PySide6.QtCore import Slot
 from PySide6.QtGui import QTextCursor
@@ -19,7 +19,7 @@ class CompletionDialog(BaseGenerationDialog):
         self.current_prompt = prompt
 
         self.display_area.setReadOnly(False)
-        self.display_area.setText(self.current_prompt)
+        self.display_area.setPlainText(self.current_prompt)
 
     def _add_custom_buttons(self, layout: QHBoxLayout):
         self.regen_button = QPushButton("Regenerate Response")
@@ -45,6 +45,10 @@ class ChatDialog(BaseGenerationDialog):
         self.openai_service = openai_service
         self.data = data
         self.response_start_pos = 0
+        # Document position (UTF-16 units) where the response starts, which can differ from len(history).
+        self._response_start_cursor_pos = 0
+        self._history_text: Optional[str] = None
+        self._history_key: Optional[Tuple[int, int]] = None
 
     def _add_custom_buttons(self, layout: QHBoxLayout):
         self.copy_button = QPushButton("Copy Response")
@@ -56,11 +60,13 @@ class ChatDialog(BaseGenerationDialog):
         layout.insertWidget(1, self.regen_button)
 
     def start_generation(self):
-        self.display_area.clear()
-        history = self._format_chat_history(self.data)
-        self.display_area.insertPlainText(history)
+        history = self._get_chat_history()
+        self.display_area.setPlainText(history)
         self.response_start_pos = len(history)
+        self._response_start_cursor_pos = self.display_area.document().characterCount() - 1
+        self._start_worker()
 
+    def _start_worker(self):
         self.worker = ChatWorker(self.openai_service, self.data, self)
         super().start_generation()
 
@@ -72,7 +78,24 @@ class ChatDialog(BaseGenerationDialog):
         QMessageBox.information(self, "Copied", "Response copied to clipboard.")
 
     def _regenerate_response(self):
-        self.start_generation()
+        if self._response_start_cursor_pos == 0:
+            self.start_generation()
+            return
+
+        # The history is already on screen; only the previous response is removed.
+        cursor = QTextCursor(self.display_area.document())
+        cursor.setPosition(self._response_start_cursor_pos)
+        cursor.movePosition(QTextCursor.MoveOperation.End, QTextCursor.MoveMode.KeepAnchor)
+        cursor.removeSelectedText()
+        self._start_worker()
+
+    def _get_chat_history(self) -> str:
+        # The history only changes if a different message list is passed in, so regenerating reuses the formatted text.
+        key = (id(self.data), len(self.data))
+        if self._history_text is None or key != self._history_key:
+            self._history_text = self._format_chat_history(self.data)
+            self._history_key = key
+        return self._history_text
 
     def _format_chat_history(self, messages: List[Dict]) -> str:
         formatted = [f"<{m['role'].upper()}>\n{m['content']}\n" for m in messages]
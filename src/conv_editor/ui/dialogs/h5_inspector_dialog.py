@@ -1,10 +1,10 @@
-import html
 import logging
+from collections import OrderedDict
 from pathlib import Path
 from typing import List, Optional, Tuple
 
-from PySide6.QtCore import Qt
-from PySide6.QtGui import QCloseEvent, QKeyEvent
+from PySide6.QtCore import QObject, QRunnable, Qt, QThread, QThreadPool, QTimer, Signal, Slot
+from PySide6.QtGui import QCloseEvent, QFont, QKeyEvent, QTextCursor, QTextDocument
 from PySide6.QtWidgets import (
     QDialog,
     QFileDialog,
@@ -20,21 +20,140 @@ from PySide6.QtWidgets import (
     QVBoxLayout,
 )
 
-from conv_editor.config.settings import settings
+from conv_editor.config.settings import get_settings
 from conv_editor.services.h5_reader_service import H5ReaderService
+from conv_editor.ui.dialogs.dialog_options import file_dialog_options
 
 logger = logging.getLogger(__name__)
 
+# Same escapes as html.escape, plus newlines to <br>, in a single pass.
+_HTML_NL_TABLE = str.maketrans({"&": "&amp;", "<": "&lt;", ">": "&gt;", '"': "&quot;", "'": "&#x27;", "\n": "<br>"})
+
+try:
+    from markupsafe import escape as _markupsafe_escape
+
+    def _escape_html(text: str) -> str:
+        # markupsafe's C speedups escape in one native pass; str.replace is called unbound because Markup.replace would escape "<br>".
+        return str.replace(_markupsafe_escape(text), "\n", "<br>")
+
+except ImportError:
+
+    def _escape_html(text: str) -> str:
+        return text.translate(_HTML_NL_TABLE)
+
+
+_PRE_OPEN = '<pre style="font-family: Consolas, monospace; white-space: pre-wrap;">'
+_PRE_CLOSE = "</pre>"
+_SPAN_CLOSE = "</span>"
+
+
+def _format_as_html(data: List[Tuple[str, bool]], unlearnable_color: str) -> str:
+    open_span = f'<span style="background-color:{unlearnable_color};">'
+    parts = [_PRE_OPEN]
+    for text, is_learnable in data:
+        escaped_text = _escape_html(text)
+        if is_learnable:
+            parts.append(escaped_text)
+        else:
+            parts.extend((open_span, escaped_text, _SPAN_CLOSE))
+    parts.append(_PRE_CLOSE)
+    return "".join(parts)
+
+
+class _RenderSignals(QObject):
+    finished = Signal(object, object)  # task, QTextDocument
+
+
+class _HtmlRenderTask(QRunnable):
+    def __init__(self, data: List[Tuple[str, bool]], unlearnable_color: str, font: QFont, html_content: Optional[str] = None):
+        super().__init__()
+        # The dialog keeps a reference for cancellation, so Qt must not delete the task after run().
+        self.setAutoDelete(False)
+        self.data = data
+        self.unlearnable_color = unlearnable_color
+        self.font = font
+        self.html_content = html_content
+        self.target_thread = QThread.currentThread()
+        self.signals = _RenderSignals()
+        self.cancelled = False
+
+    def run(self):
+        if self.cancelled:
+            return
+        if self.html_content is None:
+            self.html_content = _format_as_html(self.data, self.unlearnable_color)
+        if self.cancelled:
+            return
+        # HTML parsing happens here, off the UI thread; the finished document is handed back to the dialog's thread.
+        doc = QTextDocument()
+        doc.setDefaultFont(self.font)
+        doc.setUndoRedoEnabled(False)
+        doc.setHtml(self.html_content)
+        doc.moveToThread(self.target_thread)
+        self.signals.finished.emit(self, doc)
+
+
+class _PrefetchSignals(QObject):
+    loaded = Signal(object, int, object)  # reader, index, decoded turns
+
+
+class _PrefetchTask(QRunnable):
+    def __init__(self, reader: H5ReaderService, indices: List[int]):
+        super().__init__()
+        self.reader = reader
+        self.indices = indices
+        self.signals = _PrefetchSignals()
+
+    def run(self):
+        for index in self.indices:
+            try:
+                data = self.reader.get_processed_conversation(index)
+            except Exception as e:
+                logger.debug(f"Prefetch of conversation {index} skipped: {e}")
+                return
+            self.signals.loaded.emit(self.reader, index, data)
+
+
+class _LoadSignals(QObject):
+    finished = Signal(object, object)  # reader, exception or None
+
+
+class _LoadTask(QRunnable):
+    def __init__(self, reader: H5ReaderService):
+        super().__init__()
+        self.reader = reader
+        self.signals = _LoadSignals()
+
+    def run(self):
+        try:
+            self.reader.load()
+        except Exception as e:
+            self.signals.finished.emit(self.reader, e)
+            return
+        self.signals.finished.emit(self.reader, None)
+
 
 class H5InspectorDialog(QDialog):
+    TURNS_PER_PAGE = 500
+    APPEND_CHUNK_TURNS = 100
+    PAGE_CACHE_SIZE = 32
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setWindowTitle("HDF5 Dataset Inspector")
         self.setMinimumSize(800, 600)
 
         self.reader_service: Optional[H5ReaderService] = None
+        self._pending_reader: Optional[H5ReaderService] = None
         self.current_index: int = 0
         self.total_conversations: int = 0
+        # Long conversations are handed to the document a window of turns at a time, as the view scrolls down.
+        self._current_data: List[Tuple[str, bool]] = []
+        self._rendered_turns: int = 0
+        self._append_until: int = 0
+        self._render_task: Optional[_HtmlRenderTask] = None
+        # Recently viewed conversations: decoded turns plus the HTML of their first window, once rendered.
+        self._page_cache: OrderedDict[int, Tuple[List[Tuple[str, bool]], Optional[str]]] = OrderedDict()
 
         self._setup_ui()
         self._connect_signals()
@@ -70,6 +189,7 @@ class H5InspectorDialog(QDialog):
         # Display Area
         self.display_area = QTextEdit()
         self.display_area.setReadOnly(True)
+        self.display_area.setUndoRedoEnabled(False)
         self.display_area.setLineWrapMode(QTextEdit.LineWrapMode.NoWrap)
         main_layout.addWidget(self.display_area)
 
@@ -104,6 +224,7 @@ class H5InspectorDialog(QDialog):
         self.prev_button.clicked.connect(self._on_previous)
         self.next_button.clicked.connect(self._on_next)
         self.jump_button.clicked.connect(self._on_jump_to)
+        self.display_area.verticalScrollBar().valueChanged.connect(self._render_more_if_needed)
 
     def keyPressEvent(self, event: QKeyEvent):
         key = event.key()
@@ -118,12 +239,12 @@ class H5InspectorDialog(QDialog):
             super().keyPressEvent(event)
 
     def _browse_h5(self):
-        path, _ = QFileDialog.getOpenFileName(self, "Select HDF5 File", "", "HDF5 files (*.h5 *.hdf5)")
+        path, _ = QFileDialog.getOpenFileName(self, "Select HDF5 File", "", "HDF5 files (*.h5 *.hdf5)", options=file_dialog_options())
         if path:
             self.h5_path_edit.setText(path)
 
     def _browse_tokenizer(self):
-        path, _ = QFileDialog.getOpenFileName(self, "Select Tokenizer", "", "Tokenizer files (*.json)")
+        path, _ = QFileDialog.getOpenFileName(self, "Select Tokenizer", "", "Tokenizer files (*.json)", options=file_dialog_options())
         if path:
             self.tokenizer_path_edit.setText(path)
 
@@ -136,38 +257,57 @@ class H5InspectorDialog(QDialog):
             return
 
         self.status_label.setText("Loading dataset...")
-        try:
-            if self.reader_service:
-                self.reader_service.close()
-
-            self.reader_service = H5ReaderService(Path(h5_path_str), Path(tokenizer_path_str))
-            self.reader_service.load()
+        if self.reader_service:
+            self.reader_service.close()
+            self.reader_service = None
+        self._page_cache.clear()
+        self.total_conversations = 0
+        self._update_ui_state()
+        self.load_button.setEnabled(False)
+
+        # Opening the file and parsing the tokenizer can take a while for large datasets, so it happens off the UI thread.
+        self._pending_reader = H5ReaderService(Path(h5_path_str), Path(tokenizer_path_str))
+        task = _LoadTask(self._pending_reader)
+        task.signals.finished.connect(self._on_dataset_loaded)
+        QThreadPool.globalInstance().start(task)
+
+    @Slot(object, object)
+    def _on_dataset_loaded(self, reader: H5ReaderService, error: Optional[Exception]):
+        if reader is not self._pending_reader:
+            reader.close()
+            return
+        self._pending_reader = None
 
-            self.total_conversations = self.reader_service.conversation_count
+        if error is not None:
+            QMessageBox.critical(self, "Loading Error", f"Failed to load dataset:\n\n{error}")
+            self.status_label.setText("Error loading dataset. Please check files and try again.")
+            reader.close()
+        else:
+            self.reader_service = reader
+            self.total_conversations = reader.conversation_count
             self.current_index = 0
             self.page_jump_spinbox.setMaximum(self.total_conversations or 1)
             self._render_current_conversation()
             self.status_label.setText(f"Successfully loaded {self.total_conversations} conversations.")
 
-        except (FileNotFoundError, ValueError, IndexError, IOError) as e:
-            QMessageBox.critical(self, "Loading Error", f"Failed to load dataset:\n\n{e}")
-            self.status_label.setText("Error loading dataset. Please check files and try again.")
-            if self.reader_service:
-                self.reader_service.close()
-                self.reader_service = None
-            self.total_conversations = 0
-
         self._update_ui_state()
 
     def _render_current_conversation(self):
+        self._cancel_render()
+        self._current_data = []
+        self._rendered_turns = 0
+        self._append_until = 0
         if not self.reader_service or self.total_conversations == 0:
             self.display_area.clear()
             return
 
         try:
-            data = self.reader_service.get_processed_conversation(self.current_index)
-            html_content = self._format_as_html(data)
-            self.display_area.setHtml(html_content)
+            data, html_content = self._get_page(self.current_index)
+            self._current_data = data
+            self._rendered_turns = min(len(data), self.TURNS_PER_PAGE)
+            self._render_task = _HtmlRenderTask(data[: self._rendered_turns], get_settings().APP_THEME_UNLEARNABLE_BG, self.display_area.font(), html_content)
+            self._render_task.signals.finished.connect(self._on_document_rendered)
+            QThreadPool.globalInstance().start(self._render_task)
         except Exception as e:
             logger.exception(f"Error rendering conversation index {self.current_index}")
             self.display_area.setPlainText(f"Error rendering conversation: {e}")
@@ -175,16 +315,82 @@ class H5InspectorDialog(QDialog):
         self.page_label.setText(f"Conversation {self.current_index + 1} of {self.total_conversations}")
         self.page_jump_spinbox.setValue(self.current_index + 1)
 
-    def _format_as_html(self, data: List[Tuple[str, bool]]) -> str:
-        unlearnable_color = settings.APP_THEME_UNLEARNABLE_BG
-        parts = []
-        for text, is_learnable in data:
-            escaped_text = html.escape(text).replace("\n", "<br>")
-            if is_learnable:
-                parts.append(escaped_text)
-            else:
-                parts.append(f'<span style="background-color:{unlearnable_color};">{escaped_text}</span>')
-        return f'<pre style="font-family: Consolas, monospace; white-space: pre-wrap;">{"".join(parts)}</pre>'
+    def _get_page(self, index: int) -> Tuple[List[Tuple[str, bool]], Optional[str]]:
+        page = self._page_cache.get(index)
+        if page is not None:
+            self._page_cache.move_to_end(index)
+            return page
+        page = (self.reader_service.get_processed_conversation(index), None)
+        self._store_page(index, page)
+        return page
+
+    def _store_page(self, index: int, page: Tuple[List[Tuple[str, bool]], Optional[str]]):
+        self._page_cache[index] = page
+        self._page_cache.move_to_end(index)
+        while len(self._page_cache) > self.PAGE_CACHE_SIZE:
+            self._page_cache.popitem(last=False)
+
+    def _prefetch_neighbours(self):
+        indices = [i for i in (self.current_index + 1, self.current_index - 1) if 0 <= i < self.total_conversations and i not in self._page_cache]
+        if not indices or not self.reader_service:
+            return
+        task = _PrefetchTask(self.reader_service, indices)
+        task.signals.loaded.connect(self._on_page_prefetched)
+        QThreadPool.globalInstance().start(task)
+
+    @Slot(object, int, object)
+    def _on_page_prefetched(self, reader: H5ReaderService, index: int, data: List[Tuple[str, bool]]):
+        if reader is self.reader_service and index not in self._page_cache:
+            self._store_page(index, (data, None))
+
+    def _cancel_render(self):
+        if self._render_task is not None:
+            self._render_task.cancelled = True
+            self._render_task = None
+
+    @Slot(object, object)
+    def _on_document_rendered(self, task: _HtmlRenderTask, doc: QTextDocument):
+        if task is not self._render_task:
+            return
+        self._render_task = None
+        self._store_page(self.current_index, (self._current_data, task.html_content))
+        self._prefetch_neighbours()
+
+        # The editor only frees documents it created itself, so the ones handed over here are released by hand.
+        old_doc = self.display_area.document()
+        owned = old_doc.parent() is self.display_area
+        doc.setParent(self.display_area)
+        self.display_area.setDocument(doc)
+        if owned:
+            old_doc.deleteLater()
+        QTimer.singleShot(0, self._render_more_if_needed)
+
+    @Slot()
+    def _render_more_if_needed(self):
+        if self._render_task is not None or self._rendered_turns < self._append_until or self._rendered_turns >= len(self._current_data):
+            return
+        scrollbar = self.display_area.verticalScrollBar()
+        if scrollbar.value() < scrollbar.maximum() - scrollbar.pageStep():
+            return
+
+        self._append_until = min(len(self._current_data), self._rendered_turns + self.TURNS_PER_PAGE)
+        self._append_next_chunk()
+
+    @Slot()
+    def _append_next_chunk(self):
+        if self._rendered_turns >= self._append_until:
+            # Re-check once the new text is laid out, in case it still doesn't fill the view.
+            QTimer.singleShot(0, self._render_more_if_needed)
+            return
+
+        start = self._rendered_turns
+        self._rendered_turns = min(self._append_until, start + self.APPEND_CHUNK_TURNS)
+        # Inserting at the end extends the existing document instead of re-parsing everything shown so far,
+        # and one slice per event-loop pass keeps scrolling responsive while a window streams in.
+        cursor = QTextCursor(self.display_area.document())
+        cursor.movePosition(QTextCursor.MoveOperation.End)
+        cursor.insertHtml(_format_as_html(self._current_data[start : self._rendered_turns], get_settings().APP_THEME_UNLEARNABLE_BG))
+        QTimer.singleShot(0, self._append_next_chunk)
 
     def _on_previous(self):
         if self.current_index > 0:
@@ -224,6 +430,8 @@ class H5InspectorDialog(QDialog):
             self.page_label.setText("Conversation 0 of 0")
 
     def closeEvent(self, event: QCloseEvent):
+        self._cancel_render()
+        self._pending_reader = None
         if self.reader_service:
             self.reader_service.close()
         super().closeEvent(event)
@@ -1,35 +1,87 @@
 import json
 import logging
-from typing import List, Optional
-
-from PySide6.QtCore import Qt, QTimer, Signal, Slot
-from PySide6.QtGui import QColor, QTextCharFormat
+import os
+import re
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict
+from pathlib import Path
+from typing import TYPE_CHECKING, List, Optional, Tuple
+
+from PySide6.QtCore import QModelIndex, QObject, QRunnable, Qt, QThreadPool, QTimer, Signal, Slot
+from PySide6.QtGui import QColor, QKeySequence, QTextCharFormat, QTextCursor
 from PySide6.QtWidgets import (
-    QCheckBox,
     QDialog,
     QDialogButtonBox,
-    QGridLayout,
     QHBoxLayout,
     QLabel,
     QLineEdit,
-    QListWidget,
-    QListWidgetItem,
-    QSpinBox,
+    QListView,
+    QPushButton,
     QSplitter,
+    QStackedWidget,
     QTextEdit,
     QVBoxLayout,
     QWidget,
 )
 
 from conv_editor.core.models import SearchMatch
-from conv_editor.ui.widgets.search_result_widget import SearchResultWidget
-from conv_editor.workers.search_worker import SearchWorker
+from conv_editor.ui.widgets.search_options_widget import SearchOptionsWidget
+from conv_editor.ui.widgets.search_result_widget import SearchResultDelegate, SearchResultsModel
+
+if TYPE_CHECKING:
+    from conv_editor.workers.search_worker import SearchWorker
 
 logger = logging.getLogger(__name__)
 
+try:
+    import orjson
+
+    def _load_pretty_json(file_path: str) -> str:
+        return orjson.dumps(orjson.loads(Path(file_path).read_bytes()), option=orjson.OPT_INDENT_2).decode("utf-8")
+
+except ImportError:
+
+    def _load_pretty_json(file_path: str) -> str:
+        # Same layout as orjson's OPT_INDENT_2, non-ASCII text included verbatim so it can be highlighted.
+        return json.dumps(json.loads(Path(file_path).read_bytes()), indent=2, ensure_ascii=False)
+
+
+_HIGHLIGHT_FMT = QTextCharFormat()
+_HIGHLIGHT_FMT.setBackground(QColor("#D2B48C"))
+_HIGHLIGHT_FMT.setForeground(QColor("black"))
+
+
+def _utf16_offset(text: str, index: int) -> int:
+    # QTextDocument positions count UTF-16 code units, which only differ from str indices past astral characters.
+    return index if text.isascii() else len(text[:index].encode("utf-16-le")) // 2
+
+
+class _PreviewSignals(QObject):
+    loaded = Signal(int, str, object, str)  # request id, path, mtime_ns, pretty JSON
+    failed = Signal(int, str, str)  # request id, path, error
+
+
+class _PreviewLoader(QRunnable):
+    def __init__(self, req_id: int, file_path: str):
+        super().__init__()
+        self.req_id = req_id
+        self.file_path = file_path
+        self.signals = _PreviewSignals()
+
+    def run(self):
+        try:
+            mtime = os.stat(self.file_path).st_mtime_ns
+            pretty_content = _load_pretty_json(self.file_path)
+        except (IOError, ValueError) as e:
+            self.signals.failed.emit(self.req_id, self.file_path, str(e))
+            return
+        self.signals.loaded.emit(self.req_id, self.file_path, mtime, pretty_content)
+
 
 class SearchDialog(QDialog):
     search_result_selected = Signal(SearchMatch)
+    _PREVIEW_CACHE_MAX = 32
+    PREVIEW_CONTEXT_LINES = 200
 
     def __init__(self, root_dir: str, score_cutoff: int, parent=None):
         super().__init__(parent)
@@ -38,16 +90,44 @@ class SearchDialog(QDialog):
         self.root_dir = root_dir
         self.initial_score_cutoff = score_cutoff
 
-        self.search_worker: Optional[SearchWorker] = None
-        self.search_timer = QTimer(self)
-        self.search_timer.setInterval(300)
-        self.search_timer.setSingleShot(True)
-        self.current_results: List[SearchMatch] = []
-        self.preview_cache: dict = {"path": None, "content": None}
+        self.search_worker: Optional["SearchWorker"] = None
+        # The first edit searches immediately; edits during the cooldown are coalesced and caught by the trailing timer.
+        self._cooldown_timer = QTimer(self)
+        self._cooldown_timer.setInterval(150)
+        self._cooldown_timer.setSingleShot(True)
+        self._trailing_timer = QTimer(self)
+        self._trailing_timer.setInterval(300)
+        self._trailing_timer.setSingleShot(True)
+        self._last_query = ""
+        self._search_pending = False
+        # Results arriving from the worker are added to the list in bursts rather than one relayout per match.
+        self._pending_results: List[SearchMatch] = []
+        self._result_flush_timer = QTimer(self)
+        self._result_flush_timer.setInterval(50)
+        self._result_flush_timer.setSingleShot(True)
+        self.results_model = SearchResultsModel(self)
+        # (query, fuzzy, cutoff, case-insensitive, max results) of the search on screen, and the full result list of the
+        # last completed search with those settings, so a narrower max can be served without walking the tree again.
+        self._last_search_key: Optional[Tuple] = None
+        self._last_results_full: List[SearchMatch] = []
+        # The dispatched query, compiled once per search for preview highlighting and match navigation.
+        self._needle: Optional[re.Pattern] = None
+        # Pretty-printed previews keyed by file path, tagged with the file's mtime so edited files are re-read.
+        self._preview_lru: OrderedDict[str, Tuple[int, str]] = OrderedDict()
+        self._preview_req_id = 0
+        self._preview_result: Optional[SearchMatch] = None
+        # Rows are only ever appended until the next search resets the model, so a row number identifies the preview on screen.
+        self._displayed_row = -1
+        self._shown_preview: Optional[Tuple[SearchMatch, str]] = None
+        # Offsets of every occurrence of the query in the displayed preview, found once per preview so
+        # next/previous just move the cursor.
+        self._preview_text = ""
+        self._match_offsets: List[int] = []
+        self._match_len = 0
+        self._match_anchor = -1
 
         self._setup_ui()
         self._connect_signals()
-        self._update_options_state()
 
     def _setup_ui(self):
         main_layout = QVBoxLayout(self)
@@ -67,10 +147,15 @@ class SearchDialog(QDialog):
         search_input_layout.addWidget(self.search_edit)
         left_layout.addLayout(search_input_layout)
 
-        self._setup_options_ui(left_layout)
+        self.options = SearchOptionsWidget(self.initial_score_cutoff)
+        left_layout.addWidget(self.options)
 
-        self.results_list = QListWidget()
+        self.results_list = QListView()
+        self.results_list.setModel(self.results_model)
+        self.results_list.setEditTriggers(QListView.EditTrigger.NoEditTriggers)
         self.results_list.setAlternatingRowColors(True)
+        self.results_list.setUniformItemSizes(True)
+        self.results_list.setItemDelegate(SearchResultDelegate(self.results_list))
         left_layout.addWidget(self.results_list)
 
         right_pane = QWidget()
@@ -81,11 +166,26 @@ class SearchDialog(QDialog):
         self.preview_path_label.setWordWrap(True)
         right_layout.addWidget(self.preview_path_label)
 
-        self.preview_text_edit = QTextEdit()
-        self.preview_text_edit.setReadOnly(True)
-        self.preview_text_edit.setFontFamily("monospace")
-        self.preview_text_edit.setLineWrapMode(QTextEdit.LineWrapMode.NoWrap)
-        right_layout.addWidget(self.preview_text_edit)
+        preview_nav_layout = QHBoxLayout()
+        self.show_full_button = QPushButton("Show full file")
+        self.show_full_button.hide()
+        preview_nav_layout.addWidget(self.show_full_button)
+        preview_nav_layout.addStretch()
+        self.match_nav_label = QLabel()
+        self.prev_match_button = QPushButton("Previous")
+        self.prev_match_button.setShortcut(QKeySequence.StandardKey.FindPrevious)
+        self.next_match_button = QPushButton("Next")
+        self.next_match_button.setShortcut(QKeySequence.StandardKey.FindNext)
+        for widget in (self.match_nav_label, self.prev_match_button, self.next_match_button):
+            widget.hide()
+            preview_nav_layout.addWidget(widget)
+        right_layout.addLayout(preview_nav_layout)
+
+        # The preview editor is only built once a result is actually opened; until then the stack holds an empty page.
+        self.preview_text_edit: Optional[QTextEdit] = None
+        self._preview_stack = QStackedWidget()
+        self._preview_stack.addWidget(QWidget())
+        right_layout.addWidget(self._preview_stack)
 
         splitter.addWidget(left_pane)
         splitter.addWidget(right_pane)
@@ -98,86 +198,102 @@ class SearchDialog(QDialog):
         button_box.rejected.connect(self.reject)
         main_layout.addWidget(button_box)
 
-    def _setup_options_ui(self, parent_layout: QVBoxLayout):
-        options_layout = QGridLayout()
-        options_layout.setContentsMargins(0, 5, 0, 5)
+    def _get_preview_edit(self) -> QTextEdit:
+        if self.preview_text_edit is None:
+            self.preview_text_edit = QTextEdit()
+            self.preview_text_edit.setReadOnly(True)
+            self.preview_text_edit.setFontFamily("monospace")
+            self.preview_text_edit.setLineWrapMode(QTextEdit.LineWrapMode.NoWrap)
+            self._preview_stack.addWidget(self.preview_text_edit)
+            self._preview_stack.setCurrentWidget(self.preview_text_edit)
+        return self.preview_text_edit
 
-        self.fuzzy_checkbox = QCheckBox("Fuzzy Search")
-        self.fuzzy_checkbox.setChecked(True)
-        self.fuzzy_checkbox.setToolTip("Enable approximate, 'fuzzy' matching.\nCan be slower than exact search.")
-
-        self.case_checkbox = QCheckBox("Case Insensitive")
-        self.case_checkbox.setToolTip("For exact search: Ignore the difference between\nUPPERCASE and lowercase letters.")
-
-        self.score_cutoff_spinbox = QSpinBox()
-        self.score_cutoff_spinbox.setRange(1, 100)
-        self.score_cutoff_spinbox.setValue(self.initial_score_cutoff)
-        self.score_cutoff_spinbox.setSuffix("%")
-        self.score_cutoff_spinbox.setToolTip("For fuzzy search: Only show results with a similarity\nscore above this value (100 is a perfect match).")
+    def _connect_signals(self):
+        self.search_edit.textChanged.connect(self._on_query_changed)
+        self._trailing_timer.timeout.connect(self._run_pending_search)
+        self._result_flush_timer.timeout.connect(self._flush_pending_results)
 
-        self.max_results_spinbox = QSpinBox()
-        self.max_results_spinbox.setRange(1, 1000)
-        self.max_results_spinbox.setValue(25)
+        self.show_full_button.clicked.connect(self._show_full_preview)
+        self.prev_match_button.clicked.connect(lambda: self._step_match(False))
+        self.next_match_button.clicked.connect(lambda: self._step_match(True))
+        self.results_list.clicked.connect(self._display_preview)
+        self.results_list.doubleClicked.connect(self._on_item_double_clicked)
 
-        options_layout.addWidget(self.fuzzy_checkbox, 0, 0)
-        options_layout.addWidget(QLabel("Score Cutoff:"), 0, 1, Qt.AlignmentFlag.AlignRight)
-        options_layout.addWidget(self.score_cutoff_spinbox, 0, 2)
-        options_layout.addWidget(self.case_checkbox, 1, 0)
-        options_layout.addWidget(QLabel("Max Results:"), 1, 1, Qt.AlignmentFlag.AlignRight)
-        options_layout.addWidget(self.max_results_spinbox, 1, 2)
-        options_layout.setColumnStretch(0, 1)
+        self.options.options_changed.connect(self._maybe_retrigger_search)
 
-        parent_layout.addLayout(options_layout)
+    @Slot(dict)
+    def _maybe_retrigger_search(self, _options: dict):
+        if self.search_edit.text().strip():
+            self._search_pending = True
+            self._trailing_timer.start()
 
-    def _connect_signals(self):
-        self.search_edit.textChanged.connect(self.search_timer.start)
-        self.search_timer.timeout.connect(self._trigger_search)
-
-        self.results_list.itemClicked.connect(self._display_preview)
-        self.results_list.itemDoubleClicked.connect(self._on_item_double_clicked)
-
-        option_widgets = [self.fuzzy_checkbox, self.case_checkbox, self.score_cutoff_spinbox, self.max_results_spinbox]
-        for widget in option_widgets:
-            if isinstance(widget, QCheckBox):
-                widget.toggled.connect(self._maybe_retrigger_search)
-            else:
-                widget.valueChanged.connect(self._maybe_retrigger_search)
-        self.fuzzy_checkbox.toggled.connect(self._update_options_state)
-
-    @Slot(bool)
-    def _update_options_state(self, is_fuzzy: bool = True):
-        self.score_cutoff_spinbox.setEnabled(is_fuzzy)
-        self.case_checkbox.setEnabled(not is_fuzzy)
-        if is_fuzzy:
-            self.case_checkbox.setChecked(False)
+    @Slot(str)
+    def _on_query_changed(self, text: str):
+        if not self._search_pending and text.strip() == self._last_query:
+            return
+        self._search_pending = True
+        if self._cooldown_timer.isActive():
+            self._trailing_timer.start()
+        else:
+            self._cooldown_timer.start()
+            self._trigger_search()
 
     @Slot()
-    def _maybe_retrigger_search(self):
-        if self.search_edit.text().strip():
-            self.search_timer.start()
+    def _run_pending_search(self):
+        if self._search_pending:
+            self._trigger_search()
 
     @Slot()
     def _trigger_search(self):
         query = self.search_edit.text().strip()
+        self._last_query = query
+        self._search_pending = False
+        is_fuzzy = self.options.is_fuzzy
+        score_cutoff = self.options.score_cutoff
+        case_insensitive = self.options.case_insensitive
+        max_results = self.options.max_results
+        key = (query, is_fuzzy, score_cutoff, case_insensitive, max_results)
+        if key == self._last_search_key:
+            return
+        previous_key, self._last_search_key = self._last_search_key, key
+        # Fuzzy scoring lowercases both sides, so its matches are highlighted case-insensitively too.
+        self._needle = re.compile(re.escape(query), re.IGNORECASE if is_fuzzy or case_insensitive else 0) if query else None
+
         self._stop_current_search()
-        self.results_list.clear()
-        self.current_results.clear()
-        self.preview_text_edit.clear()
+        self._result_flush_timer.stop()
+        self._pending_results.clear()
+        self.results_model.clear()
+        if self.preview_text_edit is not None:
+            self.preview_text_edit.clear()
         self.preview_path_label.setText("Click a result to see a preview.")
-        self.preview_cache = {"path": None, "content": None}
+        self.show_full_button.hide()
+        self._shown_preview = None
+        self._index_matches("")
+        self._preview_req_id += 1
+        self._preview_result = None
+        self._displayed_row = -1
 
         if not query:
             self.status_label.setText("Enter a query to start searching.")
             return
 
+        # Results arrive in a fixed file order, so the first N of a completed search are exactly what a search capped at N returns.
+        if previous_key is not None and previous_key[:4] == key[:4] and len(self._last_results_full) >= max_results:
+            self._pending_results = self._last_results_full[:max_results]
+            self._finish_search()
+            return
+
+        self._last_results_full = []
+        from conv_editor.workers.search_worker import SearchWorker
+
         self.status_label.setText(f"Searching for '{query}'...")
         self.search_worker = SearchWorker(
             root_dir=self.root_dir,
             query=query,
-            is_fuzzy=self.fuzzy_checkbox.isChecked(),
-            score_cutoff=self.score_cutoff_spinbox.value(),
-            case_insensitive=self.case_checkbox.isChecked(),
-            max_results=self.max_results_spinbox.value(),
+            is_fuzzy=is_fuzzy,
+            score_cutoff=score_cutoff,
+            case_insensitive=case_insensitive,
+            max_results=max_results,
             parent=self,
         )
         self.search_worker.result_found.connect(self._on_search_result_found)
@@ -185,94 +301,251 @@ class SearchDialog(QDialog):
         self.search_worker.error.connect(self._on_search_error)
         self.search_worker.start()
 
-    @Slot(QListWidgetItem)
-    def _display_preview(self, item: QListWidgetItem):
-        row = self.results_list.row(item)
-        if not (0 <= row < len(self.current_results)):
+    @Slot(QModelIndex)
+    def _display_preview(self, index: QModelIndex):
+        result = index.data(Qt.ItemDataRole.UserRole)
+        if not isinstance(result, SearchMatch) or index.row() == self._displayed_row:
             return
+        self._displayed_row = index.row()
 
-        result = self.current_results[row]
-        self.preview_path_label.setText(f"<b>Preview:</b> {result.file_path}")
+        # Any load still in flight for a previously clicked row is now stale.
+        self._preview_req_id += 1
+        self._preview_result = result
+
+        if result.pretty_preview is not None:
+            self._show_preview(result, result.pretty_preview)
+            return
 
         try:
-            if self.preview_cache["path"] != result.file_path:
-                with open(result.file_path, "r", encoding="utf-8") as f:
-                    content = json.load(f)
-                pretty_content = json.dumps(content, indent=2)
-                self.preview_cache = {"path": result.file_path, "content": pretty_content}
-                self.preview_text_edit.setPlainText(pretty_content)
-            else:
-                self.preview_text_edit.setPlainText(self.preview_cache["content"])
+            mtime = os.stat(result.file_path).st_mtime_ns
+        except OSError as e:
+            self._show_preview_error(result.file_path, e)
+            return
+
+        cached = self._preview_lru.get(result.file_path)
+        if cached is not None and cached[0] == mtime:
+            self._preview_lru.move_to_end(result.file_path)
+            self._show_preview(result, cached[1])
+            return
 
-            self._highlight_match(result)
+        self.preview_path_label.setText(f"<b>Loading…</b> {result.file_path}")
+        loader = _PreviewLoader(self._preview_req_id, result.file_path)
+        loader.signals.loaded.connect(self._on_preview_loaded)
+        loader.signals.failed.connect(self._on_preview_failed)
+        QThreadPool.globalInstance().start(loader)
 
-        except (IOError, json.JSONDecodeError) as e:
-            error_msg = f"Error reading or parsing file:\n{result.file_path}\n\n{e}"
-            self.preview_text_edit.setPlainText(error_msg)
-            logger.error(error_msg)
+    @Slot(int, str, object, str)
+    def _on_preview_loaded(self, req_id: int, file_path: str, mtime: int, pretty_content: str):
+        self._preview_lru[file_path] = (mtime, pretty_content)
+        self._preview_lru.move_to_end(file_path)
+        if len(self._preview_lru) > self._PREVIEW_CACHE_MAX:
+            self._preview_lru.popitem(last=False)
 
-    def _highlight_match(self, result: SearchMatch):
-        search_text = ""
+        if req_id == self._preview_req_id and self._preview_result is not None:
+            self._show_preview(self._preview_result, pretty_content)
+
+    @Slot(int, str, str)
+    def _on_preview_failed(self, req_id: int, file_path: str, error: str):
+        if req_id == self._preview_req_id:
+            self._show_preview_error(file_path, error)
+
+    def _show_preview(self, result: SearchMatch, pretty_content: str, full: bool = False):
+        self.preview_path_label.setText(f"<b>Preview:</b> {result.file_path}")
+        span = self._match_span(result, pretty_content)
+        text, base = (pretty_content, 0) if full else self._preview_window(pretty_content, span)
+        self._shown_preview = (result, pretty_content)
+        self.show_full_button.setVisible(text is not pretty_content)
+
+        self._get_preview_edit().setPlainText(text)
+        self._index_matches(text)
+        self._highlight_match(result, text, None if span is None else (span[0] - base, span[1] - base))
+        if span is not None:
+            self._match_anchor = span[0] - base
+        self._update_match_nav()
 
+    @Slot()
+    def _show_full_preview(self):
+        if self._shown_preview is not None:
+            self._show_preview(*self._shown_preview, full=True)
+
+    def _preview_window(self, pretty_content: str, span: Optional[Tuple[int, int]]) -> Tuple[str, int]:
+        # Only the lines around the match go into the document; a multi-megabyte file would otherwise stall the UI while it is laid out.
+        anchor = span[0] if span else 0
+        start = anchor
+        for _ in range(self.PREVIEW_CONTEXT_LINES + 1):
+            start = pretty_content.rfind("\n", 0, start)
+            if start == -1:
+                break
+        start += 1
+        end = anchor - 1
+        for _ in range(self.PREVIEW_CONTEXT_LINES + 1):
+            end = pretty_content.find("\n", end + 1)
+            if end == -1:
+                end = len(pretty_content)
+                break
+        if start == 0 and end == len(pretty_content):
+            return pretty_content, 0
+
+        above = pretty_content.count("\n", 0, start)
+        below = pretty_content.count("\n", end + 1) + 1 if end < len(pretty_content) else 0
+        header = f"… ({above} lines elided)\n" if above else ""
+        footer = f"\n… ({below} lines elided)" if below else ""
+        return header + pretty_content[start:end] + footer, start - len(header)
+
+    def _show_preview_error(self, file_path: str, error):
+        self.preview_path_label.setText(f"<b>Preview:</b> {file_path}")
+        self._shown_preview = None
+        self.show_full_button.hide()
+        self._index_matches("")
+        error_msg = f"Error reading or parsing file:\n{file_path}\n\n{error}"
+        self._get_preview_edit().setPlainText(error_msg)
+        logger.error(error_msg)
+
+    def _highlight_match(self, result: SearchMatch, text: str, span: Optional[Tuple[int, int]]):
+        if span is None:
+            span = self._fallback_span(result, text)
+            if span is None:
+                return
+
+        found_cursor = QTextCursor(self.preview_text_edit.document())
+        found_cursor.setPosition(_utf16_offset(text, span[0]))
+        found_cursor.setPosition(_utf16_offset(text, span[1]), QTextCursor.MoveMode.KeepAnchor)
+        found_cursor.mergeCharFormat(_HIGHLIGHT_FMT)
+        self.preview_text_edit.setTextCursor(found_cursor)
+        self.preview_text_edit.ensureCursorVisible()
+
+    def _fallback_span(self, result: SearchMatch, text: str) -> Optional[Tuple[int, int]]:
         if result.match_indices:
             start, end = result.match_indices
             search_text = result.preview[start:end]
-
-        if not search_text:
-            search_text = self.search_edit.text().strip()
-
-        if not search_text:
+            if search_text:
+                pos = text.find(search_text)
+                return None if pos == -1 else (pos, pos + len(search_text))
+        match = self._needle.search(text) if self._needle is not None else None
+        return match.span() if match else None
+
+    def _index_matches(self, text: str):
+        offsets = []
+        self._match_len = 0
+        if text and self._needle is not None:
+            for match in self._needle.finditer(text):
+                offsets.append(match.start())
+                self._match_len = match.end() - match.start()
+        self._preview_text = text
+        self._match_offsets = offsets
+        self._match_anchor = -1
+        self._update_match_nav()
+
+    def _step_match(self, forward: bool):
+        offsets = self._match_offsets
+        if not offsets or self.preview_text_edit is None:
             return
-
-        cursor = self.preview_text_edit.textCursor()
-        cursor.movePosition(cursor.MoveOperation.Start)
+        if forward:
+            i = bisect_right(offsets, self._match_anchor)
+            i = 0 if i == len(offsets) else i
+        else:
+            i = bisect_left(offsets, self._match_anchor) - 1
+        self._match_anchor = start = offsets[i]
+
+        text = self._preview_text
+        cursor = QTextCursor(self.preview_text_edit.document())
+        cursor.setPosition(_utf16_offset(text, start))
+        cursor.setPosition(_utf16_offset(text, start + self._match_len), QTextCursor.MoveMode.KeepAnchor)
         self.preview_text_edit.setTextCursor(cursor)
-
-        found_cursor = self.preview_text_edit.document().find(search_text)
-
-        if not found_cursor.isNull():
-            highlight_format = QTextCharFormat()
-            highlight_format.setBackground(QColor("#D2B48C"))
-            highlight_format.setForeground(QColor("black"))
-            found_cursor.mergeCharFormat(highlight_format)
-            self.preview_text_edit.setTextCursor(found_cursor)
-            self.preview_text_edit.ensureCursorVisible()
+        self.preview_text_edit.ensureCursorVisible()
+        self._update_match_nav()
+
+    def _update_match_nav(self):
+        count = len(self._match_offsets)
+        if count:
+            current = bisect_left(self._match_offsets, self._match_anchor)
+            at_match = current < count and self._match_offsets[current] == self._match_anchor
+            self.match_nav_label.setText(f"{current + 1 if at_match else '-'}/{count}")
+        for widget in (self.match_nav_label, self.prev_match_button, self.next_match_button):
+            widget.setVisible(bool(count))
+
+    @staticmethod
+    def _match_span(result: SearchMatch, pretty_content: str) -> Optional[Tuple[int, int]]:
+        # Saved conversations use the same two-space layout as the preview, so the matched line appears verbatim
+        # and the worker's offsets within it can be reused instead of scanning the document again.
+        if not result.match_indices:
+            return None
+        line = result.preview.strip()
+        line_pos = pretty_content.find(line) if line else -1
+        if line_pos == -1:
+            return None
+
+        start, end = result.match_indices
+        offset = start - (len(result.preview) - len(result.preview.lstrip()))
+        if offset < 0 or end > start + len(line) - offset:
+            return None
+        match_start = line_pos + offset
+        return match_start, match_start + end - start
+
+    def _is_current_worker(self) -> bool:
+        # A stopped worker can still have queued result_found/finished calls in flight; they belong to a search that is gone.
+        return self.search_worker is not None and self.sender() is self.search_worker
 
     @Slot(SearchMatch)
     def _on_search_result_found(self, result: SearchMatch):
-        self.current_results.append(result)
-        item = QListWidgetItem(self.results_list)
-        widget = SearchResultWidget(result, self.results_list)
-        item.setSizeHint(widget.sizeHint())
-        self.results_list.addItem(item)
-        self.results_list.setItemWidget(item, widget)
-        self.status_label.setText(f"Found {len(self.current_results)} result(s)...")
+        if not self._is_current_worker():
+            return
+        self._pending_results.append(result)
+        if not self._result_flush_timer.isActive():
+            self._result_flush_timer.start()
+
+    @Slot()
+    def _flush_pending_results(self):
+        self._result_flush_timer.stop()
+        if not self._pending_results:
+            return
+
+        self.results_model.append_results(self._pending_results)
+        self._pending_results = []
+        self.status_label.setText(f"Found {self.results_model.rowCount()} result(s)...")
 
     @Slot()
     def _on_search_finished(self):
-        count = len(self.current_results)
+        if not self._is_current_worker():
+            return
+        self._flush_pending_results()
+        results = self.results_model.results
+        if len(results) > len(self._last_results_full):
+            self._last_results_full = list(results)
+        self._finish_search()
+
+    def _finish_search(self):
+        self._flush_pending_results()
+        count = self.results_model.rowCount()
         query = self.search_edit.text()
-        limit = self.max_results_spinbox.value()
+        limit = self.options.max_results
         limit_reached = f" (limit of {limit} reached)" if count >= limit else ""
         self.status_label.setText(f"Found {count} result(s) for '{query}'{limit_reached}.")
         self.search_worker = None
 
     @Slot(str)
     def _on_search_error(self, error_message: str):
+        if not self._is_current_worker():
+            return
+        self._flush_pending_results()
+        self._last_search_key = None
         self.status_label.setText(f"Error: {error_message}")
         logger.error(f"Search worker error: {error_message}")
         self.search_worker = None
 
-    @Slot(QListWidgetItem)
-    def _on_item_double_clicked(self, item: QListWidgetItem):
-        row = self.results_list.row(item)
-        if 0 <= row < len(self.current_results):
-            selected_result = self.current_results[row]
-            self.search_result_selected.emit(selected_result)
+    @Slot(QModelIndex)
+    def _on_item_double_clicked(self, index: QModelIndex):
+        result = index.data(Qt.ItemDataRole.UserRole)
+        if isinstance(result, SearchMatch):
+            self.search_result_selected.emit(result)
 
     def _stop_current_search(self):
-        if self.search_worker and self.search_worker.isRunning():
-            self.search_worker.stop()
+        if self.search_worker:
+            self.search_worker.result_found.disconnect(self._on_search_result_found)
+            self.search_worker.finished.disconnect(self._on_search_finished)
+            self.search_worker.error.disconnect(self._on_search_error)
+            if self.search_worker.isRunning():
+                self.search_worker.stop()
         self.search_worker = None
 
     def reject(self):
@@ -1,5 +1,5 @@
-from PySide6.QtCore import Qt, Signal, Slot
-from PySide6.QtGui import QColor, QPalette
+from PySide6.QtCore import QSignalBlocker, Qt, Signal, Slot
+from PySide6.QtGui import QColor, QShowEvent
 from PySide6.QtWidgets import (
     QCheckBox,
     QColorDialog,
@@ -16,6 +16,17 @@ from PySide6.QtWidgets import (
     QVBoxLayout,
 )
 
+from conv_editor.ui.dialogs.dialog_options import color_dialog_options, file_dialog_options
+
+
+_THEME_COLOR_ROWS = (
+    ("Unlearnable BG:", "unlearnable_bg"),
+    ("Unlearnable Text:", "unlearnable_fg"),
+    ("Reasoning BG:", "reasoning_bg"),
+    ("Tools BG:", "tools_bg"),
+    ("Tool Response BG:", "tool_response_bg"),
+)
+
 
 class SettingsDialog(QDialog):
     setting_changed = Signal(str, object)  # Emits: key, value
@@ -27,41 +38,43 @@ class SettingsDialog(QDialog):
         self.setMinimumWidth(550)
         self.settings = current_settings.copy()
         self.preview_buttons = {}
+        self._colors: dict[str, QColor] = {key: QColor(self.settings[key]) for _, key in _THEME_COLOR_ROWS if key in self.settings}
         self._setup_ui()
         self._connect_signals()
 
     def _setup_ui(self):
+        # Every widget is created under its final parent, so nothing is reparented (and re-polished) when the layouts are assembled.
         main_layout = QVBoxLayout(self)
 
         # --- Project Settings Group ---
-        project_group = QGroupBox("Project Settings")
+        project_group = QGroupBox("Project Settings", self)
         project_layout = QFormLayout(project_group)
-        self.root_edit = QLineEdit(self.settings.get("root", ""))
+        self.root_edit = QLineEdit(self.settings.get("root", ""), project_group)
         self.root_edit.setReadOnly(True)
-        browse_button = QPushButton("Browse...")
+        browse_button = QPushButton("Browse...", project_group)
         root_layout = QHBoxLayout()
         root_layout.addWidget(self.root_edit)
         root_layout.addWidget(browse_button)
         project_layout.addRow("Root Folder:", root_layout)
-        self.assistant_name_edit = QLineEdit(self.settings.get("assistant_name", ""))
+        self.assistant_name_edit = QLineEdit(self.settings.get("assistant_name", ""), project_group)
         project_layout.addRow("Assistant Name:", self.assistant_name_edit)
         main_layout.addWidget(project_group)
 
         # --- AI & Generation Group ---
-        ai_group = QGroupBox("AI & Generation")
+        ai_group = QGroupBox("AI & Generation", self)
         ai_layout = QFormLayout(ai_group)
-        model_label = QLabel(f"<b>{self.settings.get('openai_model_name', 'N/A')}</b> (from .env file)")
+        model_label = QLabel(f"<b>{self.settings.get('openai_model_name', 'N/A')}</b> (from .env file)", ai_group)
         model_label.setTextFormat(Qt.TextFormat.RichText)
         ai_layout.addRow("OpenAI Model:", model_label)
-        self.reasoning_checkbox = QCheckBox("Include Reasoning (<think>) for Generation")
+        self.reasoning_checkbox = QCheckBox("Include Reasoning (<think>) for Generation", ai_group)
         self.reasoning_checkbox.setChecked(self.settings.get("reasoning", False))
         ai_layout.addRow(self.reasoning_checkbox)
         main_layout.addWidget(ai_group)
 
         # --- Editor & Behavior Group ---
-        editor_group = QGroupBox("Editor & Behavior")
+        editor_group = QGroupBox("Editor & Behavior", self)
         editor_layout = QFormLayout(editor_group)
-        self.search_cutoff_spinbox = QSpinBox()
+        self.search_cutoff_spinbox = QSpinBox(editor_group)
         self.search_cutoff_spinbox.setRange(0, 100)
         self.search_cutoff_spinbox.setValue(self.settings.get("search_score_cutoff", 75))
         self.search_cutoff_spinbox.setSuffix("%")
@@ -69,21 +82,24 @@ class SettingsDialog(QDialog):
         main_layout.addWidget(editor_group)
 
         # --- Theme Colors Group ---
-        theme_group = QGroupBox("Theme Colors")
-        theme_layout = QFormLayout(theme_group)
-        theme_layout.addRow("Unlearnable BG:", self._create_color_picker("unlearnable_bg"))
-        theme_layout.addRow("Unlearnable Text:", self._create_color_picker("unlearnable_fg"))
-        theme_layout.addRow("Reasoning BG:", self._create_color_picker("reasoning_bg"))
-        theme_layout.addRow("Tools BG:", self._create_color_picker("tools_bg"))
-        theme_layout.addRow("Tool Response BG:", self._create_color_picker("tool_response_bg"))
+        # The picker rows are filled in on first show; a dialog that is built but never opened does not pay for them.
+        theme_group = QGroupBox("Theme Colors", self)
+        self._theme_layout = QFormLayout(theme_group)
         main_layout.addWidget(theme_group)
 
         # --- Dialog Buttons ---
-        self.button_box = QDialogButtonBox(QDialogButtonBox.StandardButton.Ok | QDialogButtonBox.StandardButton.Cancel | QDialogButtonBox.StandardButton.Apply)
+        self.button_box = QDialogButtonBox(QDialogButtonBox.StandardButton.Ok | QDialogButtonBox.StandardButton.Cancel | QDialogButtonBox.StandardButton.Apply, self)
         main_layout.addWidget(self.button_box)
 
         self.browse_root_button = browse_button
 
+        self._setter_map = {
+            "root": (self.root_edit, self.root_edit.setText),
+            "assistant_name": (self.assistant_name_edit, self.assistant_name_edit.setText),
+            "reasoning": (self.reasoning_checkbox, self.reasoning_checkbox.setChecked),
+            "search_score_cutoff": (self.search_cutoff_spinbox, self.search_cutoff_spinbox.setValue),
+        }
+
     def _connect_signals(self):
         self.browse_root_button.clicked.connect(self._browse_root)
         self.assistant_name_edit.textChanged.connect(lambda text: self.setting_changed.emit("assistant_name", text))
@@ -94,14 +110,19 @@ class SettingsDialog(QDialog):
         self.button_box.rejected.connect(self.reject)  # Cancel
         self.button_box.button(QDialogButtonBox.StandardButton.Apply).clicked.connect(self.apply_clicked.emit)
 
+    def showEvent(self, event: QShowEvent):
+        if not self.preview_buttons:
+            for label, setting_key in _THEME_COLOR_ROWS:
+                self._theme_layout.addRow(label, self._create_color_picker(setting_key))
+        super().showEvent(event)
+
     def _create_color_picker(self, setting_key: str) -> QHBoxLayout:
+        group = self._theme_layout.parentWidget()
         layout = QHBoxLayout()
-        self.preview_buttons[setting_key] = QPushButton()
+        self.preview_buttons[setting_key] = QPushButton(group)
         self.preview_buttons[setting_key].setFixedSize(25, 25)
-        self.preview_buttons[setting_key].setAutoFillBackground(True)
-        self.preview_buttons[setting_key].setFlat(True)
         self._update_color_preview(setting_key)
-        choose_button = QPushButton("Choose...")
+        choose_button = QPushButton("Choose...", group)
         choose_button.clicked.connect(lambda: self._open_color_dialog(setting_key))
         layout.addWidget(self.preview_buttons[setting_key])
         layout.addWidget(choose_button)
@@ -110,45 +131,41 @@ class SettingsDialog(QDialog):
 
     @Slot(str)
     def _open_color_dialog(self, setting_key: str):
-        current_color_hex = self.settings.get(setting_key, "#ffffff")
-        color = QColorDialog.getColor(QColor(current_color_hex), self, "Select Color")
+        color = QColorDialog.getColor(self._color(setting_key), self, "Select Color", color_dialog_options())
         if color.isValid():
+            self._colors[setting_key] = color
+            # The hex string is only produced here, once per pick, for the settings dict and the listeners.
             new_color_hex = color.name()
             self.settings[setting_key] = new_color_hex
             self._update_color_preview(setting_key)
             self.setting_changed.emit(setting_key, new_color_hex)
 
+    def _color(self, setting_key: str) -> QColor:
+        color = self._colors.get(setting_key)
+        if color is None:
+            color = self._colors[setting_key] = QColor(self.settings.get(setting_key, "#ffffff"))
+        return color
+
     def _update_color_preview(self, setting_key: str):
-        color = QColor(self.settings.get(setting_key, "#ffffff"))
-        palette = self.preview_buttons[setting_key].palette()
-        palette.setColor(QPalette.ColorRole.Button, color)
-        self.preview_buttons[setting_key].setPalette(palette)
+        color = self._color(setting_key)
+        self.preview_buttons[setting_key].setStyleSheet(f"background-color: {color.name()}; border: 1px solid #888;")
 
     @Slot()
     def _browse_root(self):
-        directory = QFileDialog.getExistingDirectory(self, "Select Root Directory", self.root_edit.text() or ".")
+        directory = QFileDialog.getExistingDirectory(self, "Select Root Directory", self.root_edit.text() or ".", file_dialog_options())
         if directory:
             self.root_edit.setText(directory)
             self.setting_changed.emit("root", directory)
 
     def set_setting_value(self, key: str, value: object):
         self.settings[key] = value
-
-        if key == "root":
-            self.root_edit.blockSignals(True)
-            self.root_edit.setText(value)
-            self.root_edit.blockSignals(False)
-        elif key == "assistant_name":
-            self.assistant_name_edit.blockSignals(True)
-            self.assistant_name_edit.setText(value)
-            self.assistant_name_edit.blockSignals(False)
-        elif key == "reasoning":
-            self.reasoning_checkbox.blockSignals(True)
-            self.reasoning_checkbox.setChecked(value)
-            self.reasoning_checkbox.blockSignals(False)
-        elif key == "search_score_cutoff":
-            self.search_cutoff_spinbox.blockSignals(True)
-            self.search_cutoff_spinbox.setValue(value)
-            self.search_cutoff_spinbox.blockSignals(False)
+        if key in self._colors:
+            self._colors[key] = QColor(value)
+
+        entry = self._setter_map.get(key)
+        if entry is not None:
+            widget, setter = entry
+            with QSignalBlocker(widget):
+                setter(value)
         elif key in self.preview_buttons:
             self._update_color_preview(key)
@@ -1,13 +1,72 @@
 import logging
-from typing import Optional
+import sys
+from typing import Optional, Union
 
+import numpy as np
 from PIL.Image import Image as PILImage
-from PySide6.QtCore import Qt
-from PySide6.QtGui import QImage, QPixmap, QResizeEvent
+from PySide6.QtCore import QObject, QPoint, QRect, QRunnable, QSize, Qt, QThreadPool, QTimer, Signal, Slot
+from PySide6.QtGui import QGuiApplication, QImage, QPainter, QPaintEvent, QPixmap, QResizeEvent
 from PySide6.QtWidgets import QDialog, QDialogButtonBox, QLabel, QSizePolicy, QVBoxLayout
 
 logger = logging.getLogger(__name__)
 
+# Byte order of QImage.Format_ARGB32 pixels (a native-endian 0xAARRGGBB word): the PIL raw mode, and where alpha and colour sit.
+_ARGB32_RAW_MODE = "BGRA" if sys.byteorder == "little" else "ARGB"
+_ARGB32_ALPHA = 3 if sys.byteorder == "little" else 0
+_ARGB32_COLOR = slice(0, 3) if sys.byteorder == "little" else slice(1, 4)
+
+
+class _ScaleSignals(QObject):
+    finished = Signal(int, QSize, QImage)  # request id, target size, scaled image
+
+
+class _SmoothScaleTask(QRunnable):
+    def __init__(self, req_id: int, image: QImage, target: QSize, image_buffer: Optional[Union[bytes, np.ndarray]]):
+        super().__init__()
+        self.req_id = req_id
+        self.image = image
+        self.target = target
+        # The source image may borrow its pixels; hold them until the scale is done even if the dialog goes away first.
+        self.image_buffer = image_buffer
+        self.signals = _ScaleSignals()
+
+    def run(self):
+        scaled = self.image.scaled(self.target, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
+        self.signals.finished.emit(self.req_id, self.target, scaled)
+
+
+class _ScaledPixmapLabel(QLabel):
+    # While the size is changing the source pixmap is drawn through the painter's transform, so a resize step allocates nothing.
+    # Once a pre-scaled pixmap of exactly the displayed size arrives it is blitted 1:1 instead. Text (errors) falls back to QLabel.
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._source: Optional[QPixmap] = None
+        self._scaled: Optional[QPixmap] = None
+
+    def target_size(self) -> QSize:
+        return self.size() * 0.98
+
+    def set_source(self, pixmap: Optional[QPixmap]):
+        self._source = pixmap
+        self._scaled = None
+        self.update()
+
+    def set_scaled(self, pixmap: QPixmap):
+        self._scaled = pixmap
+        self.update()
+
+    def paintEvent(self, event: QPaintEvent):
+        if self._source is None:
+            super().paintEvent(event)
+            return
+        rect = QRect(QPoint(0, 0), self._source.size().scaled(self.target_size(), Qt.AspectRatioMode.KeepAspectRatio))
+        rect.moveCenter(self.rect().center())
+        painter = QPainter(self)
+        if self._scaled is not None and self._scaled.size() == rect.size():
+            painter.drawPixmap(rect.topLeft(), self._scaled)
+        else:
+            painter.drawPixmap(rect, self._source)
+
 
 class WordCloudDialog(QDialog):
     def __init__(self, pil_image: PILImage, parent=None):
@@ -16,52 +75,123 @@ class WordCloudDialog(QDialog):
         self.setMinimumSize(800, 400)
         self.setModal(False)
 
+        self._source_image: Optional[PILImage] = None
         self.raw_pixmap: Optional[QPixmap] = None
+        self._raw_image: Optional[QImage] = None
+        self._image_buffer: Optional[Union[bytes, np.ndarray]] = None
+        # Resizes paint the raw pixmap scaled on the fly; the smooth version is rendered once the size settles.
+        self._smooth_timer = QTimer(self)
+        self._smooth_timer.setSingleShot(True)
+        self._smooth_timer.setInterval(80)
+        self._smooth_timer.timeout.connect(self._render_smooth)
+        self._smooth_cache: Optional[tuple[QSize, QPixmap]] = None
+        self._smooth_req_id = 0
         layout = QVBoxLayout(self)
 
-        self.image_label = QLabel()
+        self.image_label = _ScaledPixmapLabel()
         self.image_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self.image_label.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
         layout.addWidget(self.image_label)
 
-        self._convert_and_set_image(pil_image)
+        self.set_image(pil_image)
 
         button_box = QDialogButtonBox(QDialogButtonBox.StandardButton.Close)
         button_box.rejected.connect(self.reject)
         layout.addWidget(button_box)
 
+    def set_image(self, pil_image: PILImage):
+        # The main window keeps one dialog and hands it every new cloud; showing the same image again needs no conversion.
+        if pil_image is self._source_image:
+            return
+        self._source_image = pil_image
+        self._smooth_timer.stop()
+        self._smooth_cache = None
+        self._smooth_req_id += 1
+        self.image_label.set_source(None)
+        self._convert_and_set_image(pil_image)
+
     def _convert_and_set_image(self, pil_image: PILImage):
         try:
-            if pil_image.mode != "RGBA":
-                pil_image = pil_image.convert("RGBA")
-
-            img_data = pil_image.tobytes("raw", "RGBA")
-            q_image = QImage(
-                img_data,
-                pil_image.width,
-                pil_image.height,
-                QImage.Format.Format_RGBA8888,
-            )
-            self.raw_pixmap = QPixmap.fromImage(q_image)
+            # RGB32 and premultiplied ARGB32 are what the raster backend draws and smooth-scales from, so fromImage can take the pixels without converting them.
+            # QImage only borrows the buffer, so it is kept alive alongside the pixmap.
+            if pil_image.has_transparency_data:
+                if pil_image.mode != "RGBA":
+                    pil_image = pil_image.convert("RGBA")
+                if pil_image.getextrema()[3][0] < 255:
+                    self._image_buffer = self._premultiplied_argb32(pil_image)
+                else:
+                    self._image_buffer = pil_image.tobytes("raw", _ARGB32_RAW_MODE)
+                q_image = QImage(self._image_buffer, pil_image.width, pil_image.height, 4 * pil_image.width, QImage.Format.Format_ARGB32_Premultiplied)
+            else:
+                # Word clouds come out as opaque RGB. PIL's RGBX packing carries the 0xff pad that RGB32 requires (its BGRX/XRGB packers write 0x00),
+                # and Qt swizzles it into an RGB32 image it owns, so no intermediate RGBA copy is made.
+                if pil_image.mode != "RGB":
+                    pil_image = pil_image.convert("RGB")
+                rgbx = pil_image.tobytes("raw", "RGBX")
+                q_image = QImage(rgbx, pil_image.width, pil_image.height, 4 * pil_image.width, QImage.Format.Format_RGBX8888).convertToFormat(QImage.Format.Format_RGB32)
+                self._image_buffer = None
+
+            # The label can never be larger than the screen, so every later resize can scale down from at most that.
+            screen = QGuiApplication.primaryScreen()
+            cap = screen.availableGeometry().size() if screen is not None else None
+            if cap is not None and (q_image.width() > cap.width() or q_image.height() > cap.height()):
+                q_image = q_image.scaled(cap, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
+                self._image_buffer = None
+            # The image is kept for the smooth scales, which run on the thread pool; the pixmap only serves the fast ones.
+            self._raw_image = q_image
+            self.raw_pixmap = QPixmap.fromImage(q_image, Qt.ImageConversionFlag.NoFormatConversion)
 
             if self.raw_pixmap.isNull():
                 self.image_label.setText("Error: Could not display image.")
             else:
+                self.image_label.set_source(self.raw_pixmap)
                 self._update_scaled_pixmap()
 
         except Exception as e:
             logger.exception("Error converting PIL image to QPixmap.")
             self.image_label.setText(f"Error displaying image:\n{e}")
 
+    @staticmethod
+    def _premultiplied_argb32(pil_image: PILImage) -> np.ndarray:
+        argb = np.frombuffer(pil_image.tobytes("raw", _ARGB32_RAW_MODE), dtype=np.uint8).reshape(pil_image.height, pil_image.width, 4)
+        # round(c * a / 255) without a division: (t + (t >> 8)) >> 8 with t = c * a + 128 is exact for 8-bit inputs.
+        t = argb[..., _ARGB32_COLOR] * argb[..., _ARGB32_ALPHA, None].astype(np.uint16)
+        t += 128
+        t += t >> 8
+        t >>= 8
+        premultiplied = np.empty_like(argb)
+        premultiplied[..., _ARGB32_COLOR] = t
+        premultiplied[..., _ARGB32_ALPHA] = argb[..., _ARGB32_ALPHA]
+        return premultiplied
+
+    def _target_size(self) -> QSize:
+        return self.image_label.target_size()
+
     def _update_scaled_pixmap(self):
         if not self.raw_pixmap:
             return
-        scaled_pixmap = self.raw_pixmap.scaled(
-            self.image_label.size() * 0.98,
-            Qt.AspectRatioMode.KeepAspectRatio,
-            Qt.TransformationMode.SmoothTransformation,
-        )
-        self.image_label.setPixmap(scaled_pixmap)
+        if self._smooth_cache is not None and self._smooth_cache[0] == self._target_size():
+            self._smooth_timer.stop()
+            self.image_label.set_scaled(self._smooth_cache[1])
+            return
+        self._smooth_timer.start()
+
+    def _render_smooth(self):
+        if self._raw_image is None:
+            return
+        self._smooth_req_id += 1
+        task = _SmoothScaleTask(self._smooth_req_id, self._raw_image, self._target_size(), self._image_buffer)
+        task.signals.finished.connect(self._on_smooth_scaled)
+        QThreadPool.globalInstance().start(task)
+
+    @Slot(int, QSize, QImage)
+    def _on_smooth_scaled(self, req_id: int, target: QSize, scaled: QImage):
+        # A newer resize has already moved on; its own task will deliver the right size.
+        if req_id != self._smooth_req_id or target != self._target_size():
+            return
+        smooth_pixmap = QPixmap.fromImage(scaled, Qt.ImageConversionFlag.NoFormatConversion)
+        self._smooth_cache = (target, smooth_pixmap)
+        self.image_label.set_scaled(smooth_pixmap)
 
     def resizeEvent(self, event: QResizeEvent):
         super().resizeEvent(event)
@@ -2,7 +2,7 @@ import json
 import logging
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional
 
 from PIL.Image import Image as PILImage
 from PySide6.QtCore import QSettings, QSize, Qt, QTimer, Slot
@@ -29,7 +29,7 @@ from PySide6.QtWidgets import (
     QWidget,
 )
 
-from conv_editor.config.settings import settings
+from conv_editor.config.settings import get_settings
 from conv_editor.core.commands.item_commands import InsertItemCommand, MoveItemCommand, RemoveItemCommand
 from conv_editor.core.commands.undo_manager import UndoManager
 from conv_editor.core.conversation import Conversation
@@ -56,6 +56,7 @@ class MainWindow(QMainWindow):
 
     def __init__(self):
         super().__init__()
+        settings = get_settings()
         self.setWindowTitle(settings.APP_NAME)
         self.resize(800, 600)
 
@@ -66,7 +67,7 @@ class MainWindow(QMainWindow):
 
         self.file_service = FileService(self.current_settings["root"])
         self.conversation = Conversation(self.current_settings["assistant_name"])
-        self.undo_manager = UndoManager()
+        self.undo_manager = UndoManager(max_size=settings.APP_UNDO_STACK_MAX)
 
         self.word_cloud_worker: Optional[WordCloudWorker] = None
         self.word_cloud_dialog: Optional[WordCloudDialog] = None
@@ -75,6 +76,9 @@ class MainWindow(QMainWindow):
         self.original_settings: Optional[dict] = None
         self._current_file: Optional[str] = None
         self._pending_scroll_index: Optional[int] = None
+        # Layout order is insertion[0], item[0], insertion[1], item[1], ..., insertion[n]; both lists mirror it.
+        self._item_widgets: List[ItemWidget] = []
+        self._insertion_widgets: List[InsertionWidget] = []
 
         self._create_actions()
         self._create_menu_bar()
@@ -92,6 +96,7 @@ class MainWindow(QMainWindow):
         QTimer.singleShot(0, self._restore_last_session)
 
     def _initialize_settings(self):
+        settings = get_settings()
         defaults = {
             "root": settings.APP_ROOT_DIR,
             "assistant_name": settings.APP_ASSISTANT_NAME,
@@ -556,16 +561,45 @@ class MainWindow(QMainWindow):
         while (item := self.conversation_layout.takeAt(0)) is not None:
             if item.widget():
                 item.widget().deleteLater()
+        self._item_widgets = []
+        self._insertion_widgets = []
 
     def _render_conversation(self):
-        self._clear_conversation_view()
-        self._add_insertion_widget(0)
+        # Items keep their identity through moves, removals and undo, so each one keeps its widget (and the insertion widget after it);
+        # only items that are new to the view are built and only the ones that left it are destroyed.
+        previous = {id(widget.item): (widget, self._insertion_widgets[i + 1]) for i, widget in enumerate(self._item_widgets)}
+        head = self._insertion_widgets[0] if self._insertion_widgets else self._create_insertion_widget(0)
+        item_widgets, insertion_widgets = [], [head]
         for index, item_data in enumerate(self.conversation.get_all_items()):
-            self._add_item_widget(item_data, index)
-            self._add_insertion_widget(index + 1)
+            slot = previous.pop(id(item_data), None)
+            if slot is None:
+                slot = (self._create_item_widget(item_data, index), self._create_insertion_widget(index + 1))
+            else:
+                slot[0].rebind(item_data, index)
+                slot[1].index = index + 1
+            item_widgets.append(slot[0])
+            insertion_widgets.append(slot[1])
+
+        layout = self.conversation_layout
+        for slot in previous.values():
+            for widget in slot:
+                layout.removeWidget(widget)
+                widget.deleteLater()
+
+        ordered = [head]
+        for item_widget, insertion_widget in zip(item_widgets, insertion_widgets[1:]):
+            ordered += (item_widget, insertion_widget)
+        for position, widget in enumerate(ordered):
+            current = layout.itemAt(position)
+            if current is None or current.widget() is not widget:
+                layout.removeWidget(widget)
+                layout.insertWidget(position, widget)
+
+        self._item_widgets = item_widgets
+        self._insertion_widgets = insertion_widgets
         self._execute_pending_scroll()
 
-    def _add_item_widget(self, item_data: Item, index: int):
+    def _create_item_widget(self, item_data: Item, index: int) -> ItemWidget:
         widget = ItemWidget(
             item=item_data,
             index=index,
@@ -580,12 +614,12 @@ class MainWindow(QMainWindow):
         widget.request_chat.connect(self._on_chat_requested)
         widget.request_global_rerender.connect(self._render_conversation)
         widget.request_global_rerender.connect(self.update_ui_state)
-        self.conversation_layout.addWidget(widget)
+        return widget
 
-    def _add_insertion_widget(self, index: int):
+    def _create_insertion_widget(self, index: int) -> InsertionWidget:
         insertion_widget = InsertionWidget(index, self.current_settings["assistant_name"], self.conversation_container)
         insertion_widget.request_insert_item.connect(self._on_insert_item_requested)
-        self.conversation_layout.addWidget(insertion_widget)
+        return insertion_widget
 
     @Slot(int, str)
     def _on_insert_item_requested(self, index: int, role: str):
@@ -737,8 +771,13 @@ class MainWindow(QMainWindow):
     @Slot(object)
     def _on_word_cloud_finished(self, pil_image: Optional[PILImage]):
         if pil_image:
-            self.word_cloud_dialog = WordCloudDialog(pil_image, self)
+            if self.word_cloud_dialog is None:
+                self.word_cloud_dialog = WordCloudDialog(pil_image, self)
+            else:
+                self.word_cloud_dialog.set_image(pil_image)
             self.word_cloud_dialog.show()
+            self.word_cloud_dialog.raise_()
+            self.word_cloud_dialog.activateWindow()
         self.wordcloud_action.setEnabled(True)
         self.statusBar().clearMessage()
         self.word_cloud_worker = None
@@ -763,7 +802,7 @@ class MainWindow(QMainWindow):
         self._update_window_title()
 
     def _update_window_title(self):
-        title = settings.APP_NAME
+        title = get_settings().APP_NAME
         if self.file_service.working_dir_name and self._current_file:
             title += f" - {self.file_service.working_dir_name}/{self._current_file}"
         if not self.undo_manager.is_clean:
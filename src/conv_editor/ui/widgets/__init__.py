@@ -3,6 +3,5 @@ from .drop_indicator import DropIndicator
 from .insertion_widget import InsertionWidget
 from .item_widget import ItemWidget
 from .maskable_text_edit import MaskableTextEdit
-from .search_result_widget import SearchResultWidget
 from .text_content_widgets import BaseTextSegmentWidget, ReasoningContentWidget, TextContentWidget
 from .tool_content_widgets import ToolCallWidget, ToolResultsWidget, ToolsWidget
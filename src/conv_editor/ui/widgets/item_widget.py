@@ -241,10 +241,28 @@ class ItemWidget(QFrame):
         last_widget = self.content_layout.itemAt(self.content_layout.count() - 1).widget()
         return self.content_layout.count(), last_widget.y() + last_widget.height()
 
+    def rebind(self, item: Item, index: int):
+        # The main window reuses this widget across renders; only what no longer matches the model is rebuilt.
+        self.index = index
+        content_changed = item is not self.item or list(map(id, item.content)) != list(map(id, self._rendered_content))
+        self.item = item
+        if content_changed:
+            self._build_content_widgets()
+        else:
+            for i in range(self.content_layout.count()):
+                widget = self.content_layout.itemAt(i).widget()
+                if isinstance(widget, BaseContentWidget):
+                    widget.item_index = index
+        if self.role_edit.text() != item.role:
+            self.role_edit.setText(item.role)
+        self._update_action_button_visibility()
+
     def _build_content_widgets(self):
         while (item := self.content_layout.takeAt(0)) is not None:
             if item.widget():
                 item.widget().deleteLater()
+        # The content commands replace, insert and remove block objects rather than editing them, so block identity tells rebind() when this is stale.
+        self._rendered_content = list(self.item.content)
 
         if not self.item.content:
             empty_label = QLabel("Click '+ Add Content' below to add text, reasoning, or tools.")
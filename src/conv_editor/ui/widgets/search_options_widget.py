@@ -0,0 +1,83 @@
+from PySide6.QtCore import Qt, Signal, Slot
+from PySide6.QtWidgets import QCheckBox, QGridLayout, QLabel, QSpinBox, QWidget
+
+
+class SearchOptionsWidget(QWidget):
+    options_changed = Signal(dict)
+
+    def __init__(self, score_cutoff: int, max_results: int = 25, parent=None):
+        super().__init__(parent)
+        self._setup_ui(score_cutoff, max_results)
+        self._connect_signals()
+        self._update_options_state(self.fuzzy_checkbox.isChecked())
+
+    def _setup_ui(self, score_cutoff: int, max_results: int):
+        options_layout = QGridLayout(self)
+        options_layout.setContentsMargins(0, 5, 0, 5)
+
+        self.fuzzy_checkbox = QCheckBox("Fuzzy Search")
+        self.fuzzy_checkbox.setChecked(True)
+        self.fuzzy_checkbox.setToolTip("Enable approximate, 'fuzzy' matching.\nCan be slower than exact search.")
+
+        self.case_checkbox = QCheckBox("Case Insensitive")
+        self.case_checkbox.setToolTip("For exact search: Ignore the difference between\nUPPERCASE and lowercase letters.")
+
+        self.score_cutoff_spinbox = QSpinBox()
+        self.score_cutoff_spinbox.setRange(1, 100)
+        self.score_cutoff_spinbox.setValue(score_cutoff)
+        self.score_cutoff_spinbox.setSuffix("%")
+        self.score_cutoff_spinbox.setToolTip("For fuzzy search: Only show results with a similarity\nscore above this value (100 is a perfect match).")
+
+        self.max_results_spinbox = QSpinBox()
+        self.max_results_spinbox.setRange(1, 1000)
+        self.max_results_spinbox.setValue(max_results)
+
+        options_layout.addWidget(self.fuzzy_checkbox, 0, 0)
+        options_layout.addWidget(QLabel("Score Cutoff:"), 0, 1, Qt.AlignmentFlag.AlignRight)
+        options_layout.addWidget(self.score_cutoff_spinbox, 0, 2)
+        options_layout.addWidget(self.case_checkbox, 1, 0)
+        options_layout.addWidget(QLabel("Max Results:"), 1, 1, Qt.AlignmentFlag.AlignRight)
+        options_layout.addWidget(self.max_results_spinbox, 1, 2)
+        options_layout.setColumnStretch(0, 1)
+
+    def _connect_signals(self):
+        self.fuzzy_checkbox.toggled.connect(self._update_options_state)
+        self.fuzzy_checkbox.toggled.connect(self._emit_options_changed)
+        self.case_checkbox.toggled.connect(self._emit_options_changed)
+        self.score_cutoff_spinbox.valueChanged.connect(self._emit_options_changed)
+        self.max_results_spinbox.valueChanged.connect(self._emit_options_changed)
+
+    @property
+    def is_fuzzy(self) -> bool:
+        return self.fuzzy_checkbox.isChecked()
+
+    @property
+    def case_insensitive(self) -> bool:
+        return self.case_checkbox.isChecked()
+
+    @property
+    def score_cutoff(self) -> int:
+        return self.score_cutoff_spinbox.value()
+
+    @property
+    def max_results(self) -> int:
+        return self.max_results_spinbox.value()
+
+    def values(self) -> dict:
+        return {
+            "is_fuzzy": self.is_fuzzy,
+            "score_cutoff": self.score_cutoff,
+            "case_insensitive": self.case_insensitive,
+            "max_results": self.max_results,
+        }
+
+    @Slot()
+    def _emit_options_changed(self):
+        self.options_changed.emit(self.values())
+
+    @Slot(bool)
+    def _update_options_state(self, is_fuzzy: bool):
+        self.score_cutoff_spinbox.setEnabled(is_fuzzy)
+        self.case_checkbox.setEnabled(not is_fuzzy)
+        if is_fuzzy:
+            self.case_checkbox.setChecked(False)
@@ -1,48 +1,142 @@
-from PySide6.QtCore import Qt
-from PySide6.QtGui import QColor
-from PySide6.QtWidgets import QLabel, QVBoxLayout, QWidget
+from typing import List
+
+from PySide6.QtCore import QAbstractListModel, QModelIndex, QPoint, QRect, QSize, Qt
+from PySide6.QtGui import QColor, QFont, QFontMetrics, QPainter, QPalette
+from PySide6.QtWidgets import QApplication, QStyle, QStyledItemDelegate, QStyleOptionViewItem
 
 from conv_editor.core.models import SearchMatch
 
 HIGHLIGHT_COLOR = QColor("#FF4500")  # OrangeRed
+HIGHLIGHT_TEXT_COLOR = QColor("white")
+
+_H_MARGIN = 5
+_V_MARGIN = 3
+_LINE_SPACING = 1
 
 
-class SearchResultWidget(QWidget):
-    def __init__(self, result: SearchMatch, parent=None):
+class SearchResultsModel(QAbstractListModel):
+    def __init__(self, parent=None):
         super().__init__(parent)
-        self._setup_ui(result)
+        self._rows: List[SearchMatch] = []
+
+    @property
+    def results(self) -> List[SearchMatch]:
+        return self._rows
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._rows)
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole):
+        if not index.isValid() or not (0 <= index.row() < len(self._rows)):
+            return None
+        result = self._rows[index.row()]
+        if role == Qt.ItemDataRole.UserRole:
+            return result
+        if role == Qt.ItemDataRole.DisplayRole:
+            return result.preview.strip()
+        if role == Qt.ItemDataRole.ToolTipRole:
+            return result.file_path
+        return None
+
+    def append_results(self, results: List[SearchMatch]):
+        if not results:
+            return
+        first = len(self._rows)
+        self.beginInsertRows(QModelIndex(), first, first + len(results) - 1)
+        self._rows.extend(results)
+        self.endInsertRows()
+
+    def clear(self):
+        self.beginResetModel()
+        self._rows = []
+        self.endResetModel()
+
 
-    def _setup_ui(self, result: SearchMatch):
-        layout = QVBoxLayout(self)
-        layout.setContentsMargins(5, 3, 5, 3)
-        layout.setSpacing(1)
+class SearchResultDelegate(QStyledItemDelegate):
+    # Paints each row straight from the SearchMatch stored under UserRole, so the list holds plain items rather than one widget tree per match.
 
-        path_label = QLabel(f"<b>File:</b> {result.file_path}")
-        path_label.setTextFormat(Qt.TextFormat.RichText)
-        path_label.setWordWrap(True)
+    def _fonts(self, option: QStyleOptionViewItem):
+        bold = QFont(option.font)
+        bold.setBold(True)
+        small = QFont(option.font)
+        small.setItalic(True)
+        if small.pointSizeF() > 0:
+            small.setPointSizeF(small.pointSizeF() * 0.85)
+        return bold, small
 
-        preview_label = QLabel()
-        preview_label.setTextFormat(Qt.TextFormat.RichText)
-        preview_label.setWordWrap(True)
-        preview_label.setText(self._format_preview(result))
+    def sizeHint(self, option: QStyleOptionViewItem, index: QModelIndex) -> QSize:
+        line_height = QFontMetrics(option.font).lineSpacing()
+        return QSize(0, 2 * line_height + _LINE_SPACING + 2 * _V_MARGIN)
 
-        layout.addWidget(path_label)
-        layout.addWidget(preview_label)
+    def paint(self, painter: QPainter, option: QStyleOptionViewItem, index: QModelIndex):
+        result = index.data(Qt.ItemDataRole.UserRole)
+        if not isinstance(result, SearchMatch):
+            super().paint(painter, option, index)
+            return
+
+        opt = QStyleOptionViewItem(option)
+        self.initStyleOption(opt, index)
+        opt.text = ""
+        style = opt.widget.style() if opt.widget else QApplication.style()
+        style.drawControl(QStyle.ControlElement.CE_ItemViewItem, opt, painter, opt.widget)
+
+        selected = bool(option.state & QStyle.StateFlag.State_Selected)
+        text_color = option.palette.color(QPalette.ColorRole.HighlightedText if selected else QPalette.ColorRole.Text)
+        bold, small = self._fonts(option)
+        fm, bold_fm, small_fm = QFontMetrics(option.font), QFontMetrics(bold), QFontMetrics(small)
+
+        rect = option.rect.adjusted(_H_MARGIN, _V_MARGIN, -_H_MARGIN, -_V_MARGIN)
+        first_baseline = rect.top() + fm.ascent()
+        second_baseline = first_baseline + fm.lineSpacing() + _LINE_SPACING
+
+        painter.save()
+        painter.setClipRect(option.rect)
+        painter.setPen(text_color)
 
-    def _format_preview(self, result: SearchMatch) -> str:
-        preview = result.preview
-        indices = result.match_indices
         item_str = f"Item:{result.item_index}" if result.item_index is not None else "Item:?"
-        prefix = f"<small><i>(Score: {result.score}, {item_str})</i></small> "
+        badge = f"Score: {result.score}, {item_str}"
+        badge_width = small_fm.horizontalAdvance(badge)
+        painter.setFont(small)
+        painter.drawText(QPoint(rect.right() - badge_width, first_baseline), badge)
+
+        x = rect.left()
+        painter.setFont(bold)
+        painter.drawText(QPoint(x, first_baseline), "File:")
+        x += bold_fm.horizontalAdvance("File: ")
+        painter.setFont(option.font)
+        path = fm.elidedText(result.file_path, Qt.TextElideMode.ElideMiddle, max(0, rect.right() - badge_width - 2 * _H_MARGIN - x))
+        painter.drawText(QPoint(x, first_baseline), path)
+
+        self._paint_preview(painter, result, rect, second_baseline, fm, bold, bold_fm)
+        painter.restore()
+
+    def _paint_preview(self, painter: QPainter, result: SearchMatch, rect: QRect, baseline: int, fm: QFontMetrics, bold: QFont, bold_fm: QFontMetrics):
+        font = QFont(painter.font())
+        x, right = rect.left(), rect.right()
+        if not result.match_indices:
+            painter.drawText(QPoint(x, baseline), fm.elidedText(result.preview.strip(), Qt.TextElideMode.ElideRight, right - x))
+            return
 
-        escaped_preview = preview.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
+        start, end = result.match_indices
+        before = result.preview[:start].lstrip()
+        matched = result.preview[start:end]
+        after = result.preview[end:].rstrip()
 
-        if not indices:
-            return f"{prefix}{escaped_preview}"
+        # Keep the match in view on long lines by eliding the leading context first.
+        before = fm.elidedText(before, Qt.TextElideMode.ElideLeft, int((right - x) * 0.4))
+        painter.drawText(QPoint(x, baseline), before)
+        x += fm.horizontalAdvance(before)
 
-        start, end = indices
-        before = escaped_preview[:start]
-        matched = escaped_preview[start:end]
-        after = escaped_preview[end:]
+        matched = bold_fm.elidedText(matched, Qt.TextElideMode.ElideRight, max(0, right - x))
+        match_width = bold_fm.horizontalAdvance(matched)
+        painter.fillRect(QRect(x, baseline - bold_fm.ascent(), match_width, bold_fm.height()), HIGHLIGHT_COLOR)
+        pen = painter.pen()
+        painter.setPen(HIGHLIGHT_TEXT_COLOR)
+        painter.setFont(bold)
+        painter.drawText(QPoint(x, baseline), matched)
+        painter.setPen(pen)
+        painter.setFont(font)
+        x += match_width
 
-        return f"{prefix}{before}<font color='{HIGHLIGHT_COLOR.name()}'><b>{matched}</b></font>{after}"
+        if x < right:
+            painter.drawText(QPoint(x, baseline), fm.elidedText(after, Qt.TextElideMode.ElideRight, right - x))
@@ -74,6 +74,8 @@ class BaseTextSegmentWidget(BaseContentWidget):
         new_segments = self.text_edit.get_segments()
         if self.content_item.segments != new_segments:
             self.content_item.segments = new_segments
+            # Typing edits the item in place; the undo command is only pushed on focus-out.
+            self.conversation_model._invalidate_fmt(self.item_index)
 
     @Slot()
     def _on_toggle_block(self):
@@ -72,6 +72,7 @@ class ToolsWidget(BaseContentWidget):
             validated_definitions = adapter.validate_python(parsed_data)
 
             self.content_item.definitions = validated_definitions
+            self.conversation_model._invalidate_fmt(self.item_index)
             self.json_edit.setStyleSheet(f"background-color: {self.colors.get('tools_bg', '#2A3B4D')}; border-radius: 4px;")
             self.json_edit.setToolTip("")
 
@@ -130,6 +131,7 @@ class ToolCallWidget(BaseContentWidget):
             validated_calls = adapter.validate_python(parsed_data)
 
             self.content_item.calls = validated_calls
+            self.conversation_model._invalidate_fmt(self.item_index)
             self.json_edit.setStyleSheet("border: none;")
             self.json_edit.setToolTip("")
 
@@ -195,6 +197,7 @@ class ToolResultsWidget(BaseContentWidget):
             validated_results = adapter.validate_python(parsed_data)
 
             self.content_item.results = validated_results
+            self.conversation_model._invalidate_fmt(self.item_index)
             self.json_edit.setStyleSheet(f"background-color: {self.colors.get('tool_response_bg', '#2A4D3B')}; border-radius: 4px;")
             self.json_edit.setToolTip("")
 
@@ -2,7 +2,9 @@ import json
 import logging
 from datetime import datetime
 from pathlib import Path
+from typing import Iterator, List
 
+import numpy as np
 from pydantic import TypeAdapter, ValidationError
 from PySide6.QtCore import QThread, Signal
 from tokenizers import Tokenizer
@@ -10,7 +12,8 @@ from tokenizers import Tokenizer
 from conv_editor.core.models import ConversationData, Item, TextContent, TextSegment
 from conv_editor.export.config import ExportConfig
 from conv_editor.export.exporter import TrainingExporter
-from conv_editor.export.hdf5_writer import HDF5Writer
+from conv_editor.export.hdf5_writer import HDF5Writer, select_token_dtype
+from conv_editor.export.parallel_exporter import ParallelExporter
 
 logger = logging.getLogger(__name__)
 
@@ -35,7 +38,10 @@ class ExportWorker(QThread):
                 self.error.emit(f"Failed to load tokenizer: {e}")
                 return
 
-            exporter = TrainingExporter(tokenizer, self.config)
+            if self.config.num_workers > 1:
+                exporter = ParallelExporter(self.config, max_workers=self.config.num_workers)
+            else:
+                exporter = TrainingExporter(tokenizer, self.config)
 
             self.status_update.emit("Scanning for conversation files...")
             root_path = Path(self.config.root_directory)
@@ -50,29 +56,17 @@ class ExportWorker(QThread):
             self.progress.emit(0, total_files)
 
             self.status_update.emit(f"Preparing to write to {self.config.output_path.name}...")
-            with HDF5Writer(self.config.output_path) as writer:
-                for i, file_path in enumerate(files_to_process):
-                    if not self._is_running:
-                        break
-
-                    self.progress.emit(i + 1, total_files)
-                    self.status_update.emit(f"Processing ({i + 1}/{total_files}): {file_path.name}")
-
-                    try:
-                        with file_path.open("r", encoding="utf-8") as f:
-                            raw_data = json.load(f)
-
-                        conversation_data = TypeAdapter(ConversationData).validate_python(raw_data)
-
-                    except (json.JSONDecodeError, ValidationError, IOError) as e:
-                        logger.warning(f"Skipping file '{file_path.name}' due to error: {e}")
-                        continue
-
-                    if not conversation_data or conversation_data[0].role != "system":
-                        self._add_system_prompt(conversation_data)
-
-                    tokenized_data = exporter.process_conversation(conversation_data)
-
+            dtype = np.int32
+            if self.config.compact_dtype:
+                dtype = select_token_dtype(tokenizer.get_vocab_size(), self.config.cross_entropy_ignore_index, self.config.store_labels_as_mask)
+
+            with HDF5Writer(
+                self.config.output_path,
+                dtype=dtype,
+                store_labels_as_mask=self.config.store_labels_as_mask,
+                ignore_index=self.config.cross_entropy_ignore_index,
+            ) as writer:
+                for tokenized_data in exporter.process_many(self._iter_conversations(files_to_process)):
                     if tokenized_data["input_ids"].size > 0:
                         writer.append(tokenized_data)
 
@@ -89,6 +83,30 @@ class ExportWorker(QThread):
             logger.exception("An unhandled error occurred in the export worker.")
             self.error.emit(f"A critical error occurred: {e}")
 
+    def _iter_conversations(self, files_to_process: List[Path]) -> Iterator[ConversationData]:
+        total_files = len(files_to_process)
+        for i, file_path in enumerate(files_to_process):
+            if not self._is_running:
+                break
+
+            self.progress.emit(i + 1, total_files)
+            self.status_update.emit(f"Processing ({i + 1}/{total_files}): {file_path.name}")
+
+            try:
+                with file_path.open("r", encoding="utf-8") as f:
+                    raw_data = json.load(f)
+
+                conversation_data = TypeAdapter(ConversationData).validate_python(raw_data)
+
+            except (json.JSONDecodeError, ValidationError, IOError) as e:
+                logger.warning(f"Skipping file '{file_path.name}' due to error: {e}")
+                continue
+
+            if not conversation_data or conversation_data[0].role != "system":
+                self._add_system_prompt(conversation_data)
+
+            yield conversation_data
+
     def _add_system_prompt(self, conversation_data: ConversationData):
         sys_prompt_path = self.config.root_directory / "sysprompt.txt"
         if not sys_prompt_path.exists():